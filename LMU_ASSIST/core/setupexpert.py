@@ -1,15 +1,69 @@
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # Необязательная зависимость - без нее используется стандартный json
+    orjson = None
+
 from .constants import AppConstants, SetupConstants
 from .exceptions import FileError, FileNotFoundError, ValidationError
 
 
+@lru_cache(maxsize=8)
+def _read_data_file(path: str, mtime_ns: int) -> bytes:
+    """Чтение файла данных (байты кэшируются по пути и времени изменения)"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _parse_data(raw: bytes) -> Dict[str, Any]:
+    """Разбор данных - у каждого экземпляра свой изменяемый словарь"""
+    # Байты UTF-8 разбираются напрямую, без промежуточного декодирования в str
+    # orjson.JSONDecodeError наследуется от json.JSONDecodeError
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+# Пояснения к параметрам: (фрагмент имени, при увеличении, при уменьшении)
+_ADJUSTMENT_HINTS = (
+    ("wing", " (больше прижима, меньше скорости)", " (меньше прижима, больше скорости)"),
+    ("brake_bias", " (больше торможения передними колесами)", " (больше торможения задними колесами)"),
+    ("tire_pressure", " (выше давление, меньше пятно контакта)", " (ниже давление, больше пятно контакта)"),
+    ("spring", " (жестче подвеска)", " (мягче подвеска)"),
+)
+
+
+@lru_cache(maxsize=None)
+def _adjustment_hints(param: str) -> Optional[tuple]:
+    """Пояснения для параметра (имя разбирается один раз на параметр)"""
+    name = param.lower()
+    for fragment, increase, decrease in _ADJUSTMENT_HINTS:
+        if fragment in name:
+            return increase, decrease
+    return None
+
+
 class SetupExpert:
     """Экспертная система для оптимизации настроек автомобиля"""
     
+    # Корректировки по погоде: погода -> (изменения, пояснение)
+    _WEATHER_ADJUSTMENTS = {
+        "light_rain": (
+            {"tire_pressure_front": +2.0, "tire_pressure_rear": +2.0,
+             "front_wing": +3, "rear_wing": +3, "brake_bias": -2},
+            "Легкий дождь: увеличено давление и прижим, смещен тормозной баланс"
+        ),
+        "heavy_rain": (
+            {"tire_pressure_front": +4.0, "tire_pressure_rear": +4.0,
+             "front_wing": +6, "rear_wing": +6, "brake_bias": -4},
+            "Сильный дождь: максимальные корректировки для безопасности"
+        )
+    }
+    
     def __init__(self, data_file: str = None):
         self.logger = logging.getLogger(__name__)
         
@@ -21,6 +75,9 @@ class SetupExpert:
         
         # Загружаем данные о машинах и трассах
         self.data = self._load_data()
+        # Разделы данных разрешаются один раз, а не при каждом запросе
+        self._cars = self.data.get("cars", {})
+        self._tracks = self.data.get("tracks", {})
         
         # Базовые правила настройки для Le Mans Ultimate
         self.setup_rules = {
@@ -85,9 +142,10 @@ class SetupExpert:
                 self.logger.warning(f"Data file not found: {self.data_file_path}")
                 return self._get_default_data()
             
-            with open(self.data_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
+            # Кэшируется только чтение файла - разбор дает каждому экземпляру свою копию
+            raw = _read_data_file(str(self.data_file_path), self.data_file_path.stat().st_mtime_ns)
+            data = _parse_data(raw)
+            
             self.logger.info(f"Data loaded successfully from {self.data_file_path}")
             return data
             
@@ -204,8 +262,8 @@ class SetupExpert:
             explanations = []
             
             # Получаем данные о машине и трассе
-            car_data = self.data.get("cars", {}).get(car_type, {})
-            track_data = self.data.get("tracks", {}).get(track_name, {})
+            car_data = self._cars.get(car_type, {})
+            track_data = self._tracks.get(track_name, {})
             
             # Анализ температурных условий
             temp_adjustments = self._analyze_temperature(conditions, explanations)
@@ -219,8 +277,9 @@ class SetupExpert:
             endurance_adjustments = self._analyze_endurance_factors(conditions, explanations)
             adjustments.update(endurance_adjustments)
             
-            # Специальный анализ для гиперкаров
-            if "hypercar" in car_type.lower():
+            # Специальный анализ для гиперкаров: признак гибрида из данных машины,
+            # разбор имени - только для машин, отсутствующих в данных
+            if car_data.get("hybrid_system", not car_data and "hypercar" in car_type.lower()):
                 hypercar_adjustments = self._analyze_hypercar_specific(telemetry, explanations)
                 adjustments.update(hypercar_adjustments)
             
@@ -357,25 +416,14 @@ class SetupExpert:
     
     def _analyze_weather(self, conditions: Dict[str, Any], explanations: List[str]) -> Dict[str, Any]:
         """Анализ погодных условий"""
-        adjustments = {}
-        weather = conditions.get("weather", "dry")
-        
-        if weather == "light_rain":
-            adjustments["tire_pressure_front"] = +2.0
-            adjustments["tire_pressure_rear"] = +2.0
-            adjustments["front_wing"] = +3
-            adjustments["rear_wing"] = +3
-            adjustments["brake_bias"] = -2
-            explanations.append("Легкий дождь: увеличено давление и прижим, смещен тормозной баланс")
-        elif weather == "heavy_rain":
-            adjustments["tire_pressure_front"] = +4.0
-            adjustments["tire_pressure_rear"] = +4.0
-            adjustments["front_wing"] = +6
-            adjustments["rear_wing"] = +6
-            adjustments["brake_bias"] = -4
-            explanations.append("Сильный дождь: максимальные корректировки для безопасности")
-        
-        return adjustments
+        entry = self._WEATHER_ADJUSTMENTS.get(conditions.get("weather", "dry"))
+        if entry is None:
+            return {}
+        
+        weather_adjustments, explanation = entry
+        explanations.append(explanation)
+        # Копия - таблица общая для всех вызовов
+        return dict(weather_adjustments)
     
     def _analyze_telemetry(self, telemetry: Dict[str, Any], explanations: List[str]) -> Dict[str, Any]:
         """Анализ телеметрии"""
@@ -460,15 +508,15 @@ class SetupExpert:
     
     def get_available_tracks(self) -> List[str]:
         """Получение списка доступных трасс"""
-        return list(self.data.get("tracks", {}).keys())
+        return list(self._tracks)
     
     def get_available_cars(self) -> List[str]:
         """Получение списка доступных автомобилей"""
-        return list(self.data.get("cars", {}).keys())
+        return list(self._cars)
     
     def get_track_recommendations(self, track_name: str) -> Dict[str, Any]:
         """Получение общих рекомендаций для трассы"""
-        track_data = self.data.get("tracks", {}).get(track_name, {})
+        track_data = self._tracks.get(track_name, {})
         
         if not track_data:
             return {"error": f"Трасса '{track_name}' не найдена"}
@@ -484,7 +532,7 @@ class SetupExpert:
     
     def get_car_specifications(self, car_type: str) -> Dict[str, Any]:
         """Получение характеристик автомобиля"""
-        car_data = self.data.get("cars", {}).get(car_type, {})
+        car_data = self._cars.get(car_type, {})
         
         if not car_data:
             return {"error": f"Автомобиль '{car_type}' не найден"}
@@ -498,26 +546,9 @@ class SetupExpert:
         for param, value in adjustments.items():
             explanation = f"[{param}]: {value:+.1f}"
             
-            if "wing" in param.lower():
-                if value > 0:
-                    explanation += " (больше прижима, меньше скорости)"
-                else:
-                    explanation += " (меньше прижима, больше скорости)"
-            elif "brake_bias" in param.lower():
-                if value > 0:
-                    explanation += " (больше торможения передними колесами)"
-                else:
-                    explanation += " (больше торможения задними колесами)"
-            elif "tire_pressure" in param.lower():
-                if value > 0:
-                    explanation += " (выше давление, меньше пятно контакта)"
-                else:
-                    explanation += " (ниже давление, больше пятно контакта)"
-            elif "spring" in param.lower():
-                if value > 0:
-                    explanation += " (жестче подвеска)"
-                else:
-                    explanation += " (мягче подвеска)"
+            hints = _adjustment_hints(param)
+            if hints:
+                explanation += hints[0] if value > 0 else hints[1]
             
             detailed_explanations.append(explanation)
         
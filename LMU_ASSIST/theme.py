@@ -3,7 +3,10 @@
 Полная реализация минималистичного дизайна с поддержкой нескольких тем
 """
 
+import sys
+import weakref
 from enum import Enum
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtGui import QPalette, QColor, QFont, QFontDatabase
@@ -72,10 +75,30 @@ class BaseTheme:
         self.animations = {}
         self.effects = {}
     
+    def _freeze_tokens(self):
+        """Фиксация токенов: после настройки тема доступна только для чтения"""
+        self.colors = MappingProxyType(self.colors)
+        self.fonts = MappingProxyType(self.fonts)
+        self.animations = MappingProxyType(self.animations)
+        self.effects = MappingProxyType(self.effects)
+    
     def get_color(self, key: str, fallback: str = "#000000") -> str:
         """Получение цвета по ключу"""
         return self.colors.get(key, fallback)
     
+    def get_qcolor(self, key: str) -> QColor:
+        """QColor для hex-цвета темы (разбирается один раз на класс темы)"""
+        cls = type(self)
+        qcolors = cls.__dict__.get('_qcolors')
+        if qcolors is None:
+            qcolors = {
+                name: QColor(value)
+                for name, value in self.colors.items()
+                if value.startswith('#')
+            }
+            cls._qcolors = qcolors
+        return qcolors[key]
+    
     def get_stylesheet(self) -> str:
         """Базовый метод для получения стилей"""
         return ""
@@ -84,13 +107,32 @@ class BaseTheme:
 class ModernDarkTheme(BaseTheme):
     """Современная темная тема с улучшенным дизайном"""
     
+    # Все секции стилей в порядке каскада
+    SECTIONS = (
+        'application', 'tab', 'button', 'input', 'container', 'component', 'list',
+        'slider', 'checkbox', 'scrollbar', 'menu', 'tooltip',
+    )
+    
+    # Секции уровня приложения (окна, фреймы, карточки, меню, подсказки)
+    APP_SECTIONS = ('application', 'container', 'component', 'menu', 'tooltip')
+    
+    # Секции, подключаемые локально к контейнерам через apply_scoped_style
+    WIDGET_SECTIONS = ('tab', 'button', 'input', 'list', 'slider', 'checkbox', 'scrollbar')
+    
+    # Цветовые варианты карточек статистики (styleClass)
+    STAT_VARIANTS = ('accent', 'success', 'warning', 'error', 'info')
+    
+    # Типы уведомлений (styleClass)
+    TOAST_VARIANTS = ('success', 'error', 'warning', 'info')
+    
     def __init__(self):
         super().__init__()
         self.name = "Modern Dark"
+        self._section_cache: Dict[str, str] = {}
         self._setup_colors()
         self._setup_fonts()
-        self._setup_animations()
         self._setup_effects()
+        self._freeze_tokens()
     
     def _setup_colors(self):
         """Настройка цветовой палитры"""
@@ -168,10 +210,7 @@ class ModernDarkTheme(BaseTheme):
         """Настройка шрифтов"""
         self.fonts = {
             'family_primary': "'Inter', 'SF Pro Display', 'Segoe UI', 'Roboto', sans-serif",
-            'family_secondary': "'JetBrains Mono', 'SF Mono', 'Consolas', monospace",
-            'family_display': "'Inter', 'SF Pro Display', sans-serif",
             
-            'size_xs': '11px',
             'size_sm': '13px',
             'size_base': '14px',
             'size_lg': '16px',
@@ -179,33 +218,13 @@ class ModernDarkTheme(BaseTheme):
             'size_2xl': '20px',
             'size_3xl': '24px',
             'size_4xl': '30px',
-            'size_5xl': '36px',
             
-            'weight_light': '300',
-            'weight_normal': '400',
             'weight_medium': '500',
             'weight_semibold': '600',
             'weight_bold': '700',
             'weight_black': '900',
         }
     
-    def _setup_animations(self):
-        """Настройка анимаций"""
-        self.animations = {
-            'duration_fast': '150ms',
-            'duration_normal': '250ms',
-            'duration_slow': '350ms',
-            'duration_slower': '500ms',
-            
-            'easing_linear': 'linear',
-            'easing_ease': 'ease',
-            'easing_ease_in': 'ease-in',
-            'easing_ease_out': 'ease-out',
-            'easing_ease_in_out': 'ease-in-out',
-            'easing_bounce': 'cubic-bezier(0.68, -0.55, 0.265, 1.55)',
-            'easing_smooth': 'cubic-bezier(0.4, 0, 0.2, 1)',
-        }
-    
     def _setup_effects(self):
         """Настройка эффектов"""
         self.effects = {
@@ -213,20 +232,38 @@ class ModernDarkTheme(BaseTheme):
             'border_radius_md': '8px',
             'border_radius_lg': '12px',
             'border_radius_xl': '16px',
-            'border_radius_2xl': '20px',
-            'border_radius_full': '50px',
-            
-            'shadow_sm': '0 1px 2px 0 rgba(0, 0, 0, 0.05)',
-            'shadow_md': '0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)',
-            'shadow_lg': '0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)',
-            'shadow_xl': '0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)',
-            'shadow_inner': 'inset 0 2px 4px 0 rgba(0, 0, 0, 0.06)',
-            
-            'blur_sm': 'blur(4px)',
-            'blur_md': 'blur(8px)',
-            'blur_lg': 'blur(16px)',
         }
     
+    def get_palette(self) -> QPalette:
+        """Палитра темы (строится один раз на класс темы)"""
+        cls = type(self)
+        palette = cls.__dict__.get('_palette')
+        if palette is None:
+            palette = self._build_palette()
+            cls._palette = palette
+        return palette
+    
+    def _build_palette(self) -> QPalette:
+        """Построение системной палитры"""
+        palette = QPalette()
+        
+        # Основные цвета
+        palette.setColor(QPalette.Window, self.get_qcolor('background'))
+        palette.setColor(QPalette.WindowText, self.get_qcolor('text_primary'))
+        palette.setColor(QPalette.Base, self.get_qcolor('background_secondary'))
+        palette.setColor(QPalette.AlternateBase, self.get_qcolor('background_tertiary'))
+        palette.setColor(QPalette.ToolTipBase, self.get_qcolor('background_elevated'))
+        palette.setColor(QPalette.ToolTipText, self.get_qcolor('text_primary'))
+        palette.setColor(QPalette.Text, self.get_qcolor('text_primary'))
+        palette.setColor(QPalette.Button, self.get_qcolor('background_secondary'))
+        palette.setColor(QPalette.ButtonText, self.get_qcolor('text_primary'))
+        palette.setColor(QPalette.BrightText, self.get_qcolor('text_inverse'))
+        palette.setColor(QPalette.Link, self.get_qcolor('accent'))
+        palette.setColor(QPalette.Highlight, self.get_qcolor('accent'))
+        palette.setColor(QPalette.HighlightedText, self.get_qcolor('text_inverse'))
+        
+        return palette
+    
     def get_application_stylesheet(self) -> str:
         """Основные стили приложения"""
         return f"""
@@ -279,6 +316,13 @@ class ModernDarkTheme(BaseTheme):
             margin-top: -1px;
         }}
         
+        QScrollArea#tabPane {{
+            background: {self.colors['background']};
+            border: 1px solid {self.colors['border']};
+            border-radius: {self.effects['border_radius_lg']};
+            margin-top: -1px;
+        }}
+        
         QTabBar {{
             qproperty-drawBase: 0;
             background: transparent;
@@ -296,13 +340,11 @@ class ModernDarkTheme(BaseTheme):
             font-weight: {self.fonts['weight_medium']};
             min-width: 120px;
             border: 1px solid transparent;
-            transition: all {self.animations['duration_normal']} {self.animations['easing_smooth']};
         }}
         
         QTabBar::tab:hover {{
             background: {self.colors['background_tertiary']};
             color: {self.colors['text_primary']};
-            transform: translateY(-1px);
             border-color: {self.colors['border_light']};
         }}
         
@@ -311,7 +353,6 @@ class ModernDarkTheme(BaseTheme):
             color: white;
             font-weight: {self.fonts['weight_semibold']};
             border-color: {self.colors['accent']};
-            box-shadow: {self.effects['shadow_md']}, 0 0 20px {self.colors['glow']};
         }}
         
         QTabBar::tab:disabled {{
@@ -333,26 +374,19 @@ class ModernDarkTheme(BaseTheme):
             font-weight: {self.fonts['weight_semibold']};
             font-size: {self.fonts['size_base']};
             min-height: 20px;
-            transition: all {self.animations['duration_normal']} {self.animations['easing_smooth']};
         }}
         
         QPushButton:hover {{
             background: {self.colors['accent_hover']};
-            transform: translateY(-2px);
-            box-shadow: {self.effects['shadow_lg']}, 0 0 25px {self.colors['glow']};
         }}
         
         QPushButton:pressed {{
             background: {self.colors['accent_pressed']};
-            transform: translateY(0px);
-            box-shadow: {self.effects['shadow_md']};
         }}
         
         QPushButton:disabled {{
             background: {self.colors['surface']};
             color: {self.colors['text_disabled']};
-            transform: none;
-            box-shadow: none;
         }}
         
         /* Вторичные кнопки */
@@ -381,7 +415,6 @@ class ModernDarkTheme(BaseTheme):
         
         QPushButton[styleClass="success"]:hover {{
             background: {self.colors['success_dark']};
-            box-shadow: {self.effects['shadow_lg']}, 0 0 25px {self.colors['glow_success']};
         }}
         
         /* Кнопки предупреждения */
@@ -402,7 +435,6 @@ class ModernDarkTheme(BaseTheme):
         
         QPushButton[styleClass="danger"]:hover {{
             background: {self.colors['error_dark']};
-            box-shadow: {self.effects['shadow_lg']}, 0 0 25px {self.colors['glow_error']};
         }}
         
         /* Кнопки-призраки */
@@ -453,7 +485,6 @@ class ModernDarkTheme(BaseTheme):
         
         QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
             border-color: {self.colors['border_focus']};
-            box-shadow: 0 0 0 3px {self.colors['glow']};
         }}
         
         QLineEdit:disabled, QTextEdit:disabled, QPlainTextEdit:disabled {{
@@ -480,7 +511,6 @@ class ModernDarkTheme(BaseTheme):
         
         QComboBox:focus {{
             border-color: {self.colors['border_focus']};
-            box-shadow: 0 0 0 3px {self.colors['glow']};
         }}
         
         QComboBox::drop-down {{
@@ -510,7 +540,6 @@ class ModernDarkTheme(BaseTheme):
             selection-color: white;
             padding: 4px;
             margin: 4px;
-            box-shadow: {self.effects['shadow_xl']};
         }}
         
         QComboBox QAbstractItemView::item {{
@@ -540,7 +569,6 @@ class ModernDarkTheme(BaseTheme):
         
         QSpinBox:focus, QDoubleSpinBox:focus {{
             border-color: {self.colors['border_focus']};
-            box-shadow: 0 0 0 3px {self.colors['glow']};
         }}
         
         QSpinBox::up-button, QDoubleSpinBox::up-button,
@@ -598,7 +626,6 @@ class ModernDarkTheme(BaseTheme):
             border: 2px solid {self.colors['border']};
             border-radius: {self.effects['border_radius_xl']};
             background: {self.colors['background_elevated']};
-            box-shadow: {self.effects['shadow_lg']};
         }}
         
         /* Сплиттеры */
@@ -622,6 +649,175 @@ class ModernDarkTheme(BaseTheme):
         }}
         """
     
+    def get_component_stylesheet(self) -> str:
+        """Стили для компонентов theme_utils и заголовка окна"""
+        variants = "".join(self._get_stat_variant_stylesheet(variant) for variant in self.STAT_VARIANTS)
+        variants += "".join(self._get_toast_variant_stylesheet(variant) for variant in self.TOAST_VARIANTS)
+        return f"""
+        /* Заголовок окна */
+        QLabel#appTitle {{
+            font-size: 32px;
+            font-weight: {self.fonts['weight_bold']};
+            margin: 16px 0;
+        }}
+        
+        /* Карточки */
+        ModernCard {{
+            background: {self.colors['background_secondary']};
+            border: 1px solid {self.colors['border']};
+            border-radius: {self.effects['border_radius_xl']};
+            padding: 24px;
+        }}
+        
+        ModernCard:hover {{
+            border-color: {self.colors['border_light']};
+            background: {self.colors['background_elevated']};
+        }}
+        
+        QLabel#cardTitle {{
+            color: {self.colors['text_primary']};
+            font-size: {self.fonts['size_xl']};
+            font-weight: {self.fonts['weight_semibold']};
+            margin-bottom: 8px;
+        }}
+        
+        QLabel#cardSubtitle {{
+            color: {self.colors['text_secondary']};
+            font-size: {self.fonts['size_base']};
+            line-height: 1.5;
+        }}
+        
+        /* Карточки статистики */
+        StatCard {{
+            padding: 0;
+        }}
+        
+        QLabel#statIcon {{
+            font-size: {self.fonts['size_3xl']};
+            font-weight: {self.fonts['weight_bold']};
+        }}
+        
+        QLabel#statValue {{
+            font-size: {self.fonts['size_4xl']};
+            font-weight: {self.fonts['weight_black']};
+            margin: 8px 0;
+        }}
+        
+        QLabel#statTitle {{
+            color: {self.colors['text_muted']};
+            font-size: {self.fonts['size_sm']};
+            font-weight: {self.fonts['weight_medium']};
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }}
+        
+        /* Стеклянная панель */
+        GlassPanel {{
+            background: {self.colors['glass']};
+            border: 1px solid {self.colors['border_light']};
+            border-radius: {self.effects['border_radius_xl']};
+        }}
+        
+        /* Слайдер с индикатором значения */
+        QLabel#sliderLabel {{
+            color: {self.colors['text_secondary']};
+            font-size: {self.fonts['size_base']};
+            font-weight: {self.fonts['weight_medium']};
+        }}
+        
+        QLabel#sliderValue {{
+            color: {self.colors['accent']};
+            font-size: {self.fonts['size_lg']};
+            font-weight: {self.fonts['weight_semibold']};
+            background: {self.colors['background_secondary']};
+            border-radius: {self.effects['border_radius_sm']};
+            padding: 6px 12px;
+            border: 1px solid {self.colors['border']};
+        }}
+        
+        /* Кнопки-иконки (радиус и размер шрифта зависят от размера кнопки) */
+        IconButton {{
+            background: transparent;
+            border: none;
+            color: {self.colors['text_secondary']};
+            font-weight: {self.fonts['weight_bold']};
+        }}
+        
+        IconButton:hover {{
+            background: {self.colors['background_secondary']};
+            color: {self.colors['text_primary']};
+        }}
+        
+        IconButton:pressed {{
+            background: {self.colors['accent']};
+            color: white;
+        }}
+        
+        /* Диалоги */
+        QLabel#dialogTitle {{
+            color: {self.colors['text_primary']};
+            font-size: {self.fonts['size_2xl']};
+            font-weight: {self.fonts['weight_semibold']};
+        }}
+        
+        /* Уведомления */
+        QFrame#toastBody {{
+            background: {self.colors['background_modal']};
+            border: 1px solid {self.colors['info']};
+            border-radius: {self.effects['border_radius_lg']};
+        }}
+        
+        QLabel#toastMessage {{
+            color: {self.colors['text_primary']};
+            font-size: {self.fonts['size_base']};
+            font-weight: {self.fonts['weight_medium']};
+        }}
+        
+        QPushButton#toastClose {{
+            background: transparent;
+            border: none;
+            color: {self.colors['text_muted']};
+            font-size: {self.fonts['size_xl']};
+            font-weight: {self.fonts['weight_bold']};
+            width: 24px;
+            height: 24px;
+            border-radius: 12px;
+        }}
+        
+        QPushButton#toastClose:hover {{
+            background: {self.colors['background_tertiary']};
+            color: {self.colors['text_primary']};
+        }}
+        {variants}"""
+    
+    def _get_stat_variant_stylesheet(self, variant: str) -> str:
+        """Цветовой вариант карточки статистики"""
+        color = self.colors[variant]
+        selector = f'StatCard[styleClass="{variant}"]'
+        return f"""
+        {selector} {{
+            border: 1px solid {color}40;
+        }}
+        
+        {selector}:hover {{
+            border-color: {color}80;
+        }}
+        
+        {selector} QLabel#statIcon, {selector} QLabel#statValue {{
+            color: {color};
+        }}
+        """
+    
+    def _get_toast_variant_stylesheet(self, variant: str) -> str:
+        """Цветовой вариант уведомления"""
+        color = self.colors[variant]
+        selector = f'NotificationToast[styleClass="{variant}"]'
+        return f"""
+        {selector} QFrame#toastBody {{
+            border-color: {color};
+        }}
+        """
+    
     def get_list_stylesheet(self) -> str:
         """Стили для списков и таблиц"""
         return f"""
@@ -643,6 +839,7 @@ class ModernDarkTheme(BaseTheme):
             border: 1px solid transparent;
         }}
         
+        /* Общие состояния элементов списков и деревьев */
         QListWidget::item:hover, QTreeWidget::item:hover {{
             background: {self.colors['background_tertiary']};
             border-color: {self.colors['border_light']};
@@ -702,6 +899,7 @@ class ModernDarkTheme(BaseTheme):
             border-bottom: 1px solid {self.colors['divider']};
         }}
         
+        /* У ячеек таблиц нет рамки, поэтому без border-color */
         QTableWidget::item:hover {{
             background: {self.colors['background_tertiary']};
         }}
@@ -730,13 +928,10 @@ class ModernDarkTheme(BaseTheme):
             border-radius: 12px;
             margin: -8px 0;
             border: 3px solid white;
-            box-shadow: {self.effects['shadow_md']};
         }}
         
         QSlider::handle:horizontal:hover {{
             background: {self.colors['accent_hover']};
-            box-shadow: {self.effects['shadow_lg']}, 0 0 20px {self.colors['glow']};
-            transform: scale(1.1);
         }}
         
         QSlider::handle:horizontal:pressed {{
@@ -763,7 +958,6 @@ class ModernDarkTheme(BaseTheme):
             border-radius: 12px;
             margin: 0 -8px;
             border: 3px solid white;
-            box-shadow: {self.effects['shadow_md']};
         }}
         
         QSlider::sub-page:vertical {{
@@ -833,7 +1027,6 @@ class ModernDarkTheme(BaseTheme):
         
         QCheckBox::indicator:checked:hover {{
             background: {self.colors['accent_hover']};
-            box-shadow: 0 0 15px {self.colors['glow']};
         }}
         
         QCheckBox::indicator:disabled {{
@@ -868,7 +1061,6 @@ class ModernDarkTheme(BaseTheme):
         
         QRadioButton::indicator:checked:hover {{
             background: {self.colors['accent_hover']};
-            box-shadow: 0 0 15px {self.colors['glow']};
         }}
         
         QRadioButton::indicator:checked::after {{
@@ -984,7 +1176,6 @@ class ModernDarkTheme(BaseTheme):
             border: 1px solid {self.colors['border']};
             border-radius: {self.effects['border_radius_lg']};
             padding: 8px;
-            box-shadow: {self.effects['shadow_xl']};
         }}
         
         QMenu::item {{
@@ -1026,26 +1217,25 @@ class ModernDarkTheme(BaseTheme):
             border-radius: {self.effects['border_radius_lg']};
             padding: 12px 16px;
             font-size: {self.fonts['size_sm']};
-            box-shadow: {self.effects['shadow_xl']};
-            backdrop-filter: {self.effects['blur_md']};
         }}
         """
     
+    def get_section_stylesheet(self, *sections: str) -> str:
+        """Стили только для указанных секций (собираются при первом запросе)"""
+        cache = self._section_cache
+        for section in sections:
+            if section not in cache:
+                cache[section] = getattr(self, f"get_{section}_stylesheet")()
+        # Интернирование: одинаковые стили разных экземпляров темы - один объект
+        return sys.intern("".join(cache[section] for section in sections))
+    
+    def get_app_stylesheet(self) -> str:
+        """Стили уровня приложения без виджетных секций"""
+        return self.get_section_stylesheet(*self.APP_SECTIONS)
+    
     def get_full_stylesheet(self) -> str:
         """Полный стиль темы"""
-        return f"""
-        {self.get_application_stylesheet()}
-        {self.get_tab_stylesheet()}
-        {self.get_button_stylesheet()}
-        {self.get_input_stylesheet()}
-        {self.get_container_stylesheet()}
-        {self.get_list_stylesheet()}
-        {self.get_slider_stylesheet()}
-        {self.get_checkbox_stylesheet()}
-        {self.get_scrollbar_stylesheet()}
-        {self.get_menu_stylesheet()}
-        {self.get_tooltip_stylesheet()}
-        """
+        return self.get_section_stylesheet(*self.SECTIONS)
 
 
 class ModernLightTheme(ModernDarkTheme):
@@ -1054,6 +1244,10 @@ class ModernLightTheme(ModernDarkTheme):
     def __init__(self):
         super().__init__()
         self.name = "Modern Light"
+    
+    def _setup_colors(self):
+        """Светлая палитра поверх базовой"""
+        super()._setup_colors()
         self._setup_light_colors()
     
     def _setup_light_colors(self):
@@ -1102,6 +1296,10 @@ class RacingTheme(ModernDarkTheme):
     def __init__(self):
         super().__init__()
         self.name = "Racing"
+    
+    def _setup_colors(self):
+        """Гоночная палитра поверх базовой"""
+        super()._setup_colors()
         self._setup_racing_colors()
     
     def _setup_racing_colors(self):
@@ -1134,35 +1332,47 @@ AVAILABLE_THEMES = {
     ThemeType.RACING: RacingTheme,
 }
 
+# Контейнеры с локально подключенными секциями стилей: виджет -> (секции, стиль)
+_scoped_widgets = weakref.WeakKeyDictionary()
+
+# Последний примененный к приложению стиль
+_app_stylesheet = None
+
+# Текущий экземпляр темы и его тип
+_theme_cache = {"type": None, "theme": None}
+
+def _restyle_scoped_widgets(theme: BaseTheme):
+    """Переприменение локальных стилей после смены темы"""
+    for widget, (sections, applied) in list(_scoped_widgets.items()):
+        stylesheet = theme.get_section_stylesheet(*sections)
+        if stylesheet is applied:
+            continue
+        try:
+            widget.setStyleSheet(stylesheet)
+            _scoped_widgets[widget] = (sections, stylesheet)
+        except RuntimeError:
+            # C++ объект виджета уже удален
+            _scoped_widgets.pop(widget, None)
+
 def apply_theme(app: QApplication, theme_type: ThemeType = ThemeType.DARK, enable_effects: bool = True):
     """Применение темы к приложению"""
+    global _app_stylesheet
+    
     try:
         # Создаем экземпляр темы
         theme_class = AVAILABLE_THEMES.get(theme_type, ModernDarkTheme)
         theme = theme_class()
         
-        # Применяем стили
-        app.setStyleSheet(theme.get_full_stylesheet())
+        # Применяем стили: на приложение только общие секции,
+        # остальные подключены к своим контейнерам
+        app_stylesheet = theme.get_app_stylesheet()
+        if app_stylesheet is not _app_stylesheet:
+            app.setStyleSheet(app_stylesheet)
+            _app_stylesheet = app_stylesheet
+        _restyle_scoped_widgets(theme)
         
         # Настраиваем системную палитру
-        palette = QPalette()
-        
-        # Основные цвета
-        palette.setColor(QPalette.Window, QColor(theme.colors['background']))
-        palette.setColor(QPalette.WindowText, QColor(theme.colors['text_primary']))
-        palette.setColor(QPalette.Base, QColor(theme.colors['background_secondary']))
-        palette.setColor(QPalette.AlternateBase, QColor(theme.colors['background_tertiary']))
-        palette.setColor(QPalette.ToolTipBase, QColor(theme.colors['background_elevated']))
-        palette.setColor(QPalette.ToolTipText, QColor(theme.colors['text_primary']))
-        palette.setColor(QPalette.Text, QColor(theme.colors['text_primary']))
-        palette.setColor(QPalette.Button, QColor(theme.colors['background_secondary']))
-        palette.setColor(QPalette.ButtonText, QColor(theme.colors['text_primary']))
-        palette.setColor(QPalette.BrightText, QColor(theme.colors['text_inverse']))
-        palette.setColor(QPalette.Link, QColor(theme.colors['accent']))
-        palette.setColor(QPalette.Highlight, QColor(theme.colors['accent']))
-        palette.setColor(QPalette.HighlightedText, QColor(theme.colors['text_inverse']))
-        
-        app.setPalette(palette)
+        app.setPalette(theme.get_palette())
         
         # Настраиваем шрифты
         if enable_effects:
@@ -1170,6 +1380,10 @@ def apply_theme(app: QApplication, theme_type: ThemeType = ThemeType.DARK, enabl
             font.setPointSize(int(theme.fonts['size_base'].replace('px', '')))
             app.setFont(font)
         
+        # Запоминаем экземпляр для get_current_theme
+        _theme_cache["type"] = theme_type
+        _theme_cache["theme"] = theme
+        
         # Обновляем менеджер тем
         theme_manager.set_theme(theme_type)
         
@@ -1180,12 +1394,29 @@ def apply_theme(app: QApplication, theme_type: ThemeType = ThemeType.DARK, enabl
         return False
 
 def get_current_theme() -> BaseTheme:
-    """Получение текущей темы"""
-    theme_class = AVAILABLE_THEMES.get(theme_manager.current_theme, ModernDarkTheme)
-    return theme_class()
+    """Получение текущей темы (экземпляр переиспользуется до смены темы)"""
+    theme_type = theme_manager.current_theme
+    if _theme_cache["theme"] is None or _theme_cache["type"] != theme_type:
+        theme_class = AVAILABLE_THEMES.get(theme_type, ModernDarkTheme)
+        _theme_cache["type"] = theme_type
+        _theme_cache["theme"] = theme_class()
+    return _theme_cache["theme"]
+
+def apply_scoped_style(widget, *sections: str):
+    """Подключение секций стилей локально к контейнеру и его потомкам"""
+    sections = sections or ModernDarkTheme.WIDGET_SECTIONS
+    entry = _scoped_widgets.get(widget)
+    if entry is not None and entry[0] == sections:
+        return
+    stylesheet = get_current_theme().get_section_stylesheet(*sections)
+    _scoped_widgets[widget] = (sections, stylesheet)
+    widget.setStyleSheet(stylesheet)
 
 def set_widget_style_class(widget, style_class: str):
     """Установка класса стиля для виджета"""
+    # Перестилизация дорогая - пропускаем, если класс не меняется
+    if widget.property("styleClass") == style_class:
+        return
     widget.setProperty("styleClass", style_class)
     widget.style().unpolish(widget)
     widget.style().polish(widget)
@@ -1193,5 +1424,5 @@ def set_widget_style_class(widget, style_class: str):
 # Экспорт основных компонентов
 __all__ = [
     'ThemeType', 'ThemeManager', 'ModernDarkTheme', 'ModernLightTheme', 'RacingTheme',
-    'apply_theme', 'get_current_theme', 'set_widget_style_class', 'theme_manager'
+    'apply_theme', 'apply_scoped_style', 'get_current_theme', 'set_widget_style_class', 'theme_manager'
 ]
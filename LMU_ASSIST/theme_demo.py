@@ -7,21 +7,39 @@
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTabWidget, QScrollArea, QGridLayout, QLabel, QLineEdit, QComboBox,
+    QTabBar, QStackedWidget, QSizePolicy, QScrollArea, QGridLayout, QLabel, QLineEdit, QComboBox,
     QCheckBox, QRadioButton, QSlider, QProgressBar, QPushButton, QGroupBox
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QEvent, QTimer
 from PyQt5.QtGui import QFont
 
 # Импортируем нашу систему тем
-from theme import apply_theme, ThemeType, get_current_theme, set_widget_style_class
+from theme import apply_theme, apply_scoped_style, ThemeType, get_current_theme, set_widget_style_class
 from theme_utils import (
-    ModernCard, ModernButton, LoadingSpinner, ProgressCard, StatCard,
+    ModernCard, ModernButton, LoadingSpinner, ProgressCard, StatCard, CategoryBars,
     NotificationToast, GlassPanel, ModernSlider, IconButton, ModernDialog,
-    show_notification, create_separator, apply_glow_effect
+    show_notification, create_separator, apply_glow_effect, attach_hover_lift
 )
 
 
+# Демо-данные вкладки статистики: (заголовок, значение, иконка, цвет)
+_STATS_DATA = (
+    ("Всего кругов", "1,247", "🏁", None),
+    ("Лучший круг", "1:23.456", "⏱️", "success"),
+    ("Средняя скорость", "187 км/ч", "🏎️", "accent"),
+    ("Время в игре", "142 ч", "⏰", "warning"),
+    ("Аварий", "23", "💥", "error"),
+    ("Подиумов", "89", "🏆", "warning"),
+)
+
+# Прогресс по категориям: (категория, процент)
+_CATEGORIES = (
+    ("Торможение", 85),
+    ("Ускорение", 78),
+    ("Повороты", 92),
+    ("Консистентность", 67),
+)
+
 class ThemeDemo(QMainWindow):
     """Демонстрация тем"""
     
@@ -44,6 +62,9 @@ class ThemeDemo(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
+        # Общие секции окна; вкладки подключают свои секции сами
+        apply_scoped_style(central_widget, 'tab', 'button', 'scrollbar')
+        
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
@@ -63,13 +84,7 @@ class ThemeDemo(QMainWindow):
         
         # Заголовок
         title = QLabel("🎨 LMU Assistant Theme Demo")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 32px;
-                font-weight: 700;
-                margin: 16px 0;
-            }
-        """)
+        title.setObjectName("appTitle")
         header_layout.addWidget(title)
         
         header_layout.addStretch()
@@ -95,6 +110,10 @@ class ThemeDemo(QMainWindow):
         notify_btn.clicked.connect(self.show_test_notification)
         theme_layout.addWidget(notify_btn)
         
+        # Тень при наведении только на кнопках заголовка
+        for btn in (dark_btn, light_btn, racing_btn, notify_btn):
+            attach_hover_lift(btn)
+        
         header_layout.addLayout(theme_layout)
         parent_layout.addLayout(header_layout)
         
@@ -103,33 +122,87 @@ class ThemeDemo(QMainWindow):
     
     def create_content_tabs(self, parent_layout):
         """Создание вкладок с контентом"""
-        tabs = QTabWidget()
-        
-        # Вкладка компонентов
-        components_tab = self.create_components_tab()
-        tabs.addTab(components_tab, "🧩 Components")
+        self.tab_bar = QTabBar()
+        for label in ("🧩 Components", "🃏 Cards", "📝 Forms", "📊 Statistics"):
+            self.tab_bar.addTab(label)
+        
+        # Страницы строятся при первом открытии; до этого - заглушки
+        self._tab_builders = {
+            0: self.create_components_tab,
+            1: self.create_cards_tab,
+            2: self.create_forms_tab,
+            3: self.create_stats_tab,
+        }
+        self.pages = QStackedWidget()
+        for _ in range(self.tab_bar.count()):
+            self.pages.addWidget(QWidget())
         
-        # Вкладка карточек
-        cards_tab = self.create_cards_tab()
-        tabs.addTab(cards_tab, "🃏 Cards")
+        # Одна область прокрутки на все страницы
+        scroll = QScrollArea()
+        scroll.setObjectName("tabPane")
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(self.pages)
         
-        # Вкладка форм
-        forms_tab = self.create_forms_tab()
-        tabs.addTab(forms_tab, "📝 Forms")
+        self._tabs_scheduled = False
         
-        # Вкладка статистики
-        stats_tab = self.create_stats_tab()
-        tabs.addTab(stats_tab, "📊 Statistics")
+        self.tab_bar.currentChanged.connect(self.on_tab_changed)
+        self.on_tab_changed(self.tab_bar.currentIndex())
         
-        parent_layout.addWidget(tabs)
+        parent_layout.addWidget(self.tab_bar)
+        parent_layout.addWidget(scroll)
+    
+    def on_tab_changed(self, index: int):
+        """Ленивое построение вкладки и пауза спиннеров вне вкладки компонентов"""
+        self.build_tab(index)
+        self.show_page(index)
+        
+        for spinner in self.spinners:
+            if index == 0:
+                spinner.start()
+            else:
+                spinner.stop()
+    
+    def show_page(self, index: int):
+        """Переключение страницы; размер области прокрутки - по текущей странице"""
+        for i in range(self.pages.count()):
+            policy = QSizePolicy.Preferred if i == index else QSizePolicy.Ignored
+            self.pages.widget(i).setSizePolicy(policy, policy)
+        self.pages.setCurrentIndex(index)
+        self.pages.adjustSize()
+    
+    def build_tab(self, index: int):
+        """Замена заглушки страницы построенным содержимым"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        
+        placeholder = self.pages.widget(index)
+        current = self.tab_bar.currentIndex()
+        # Замена страницы - одна перерисовка вместо промежуточных
+        self.pages.setUpdatesEnabled(False)
+        try:
+            page = builder()
+            if index != current:
+                page.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+            self.pages.insertWidget(index, page)
+            self.pages.removeWidget(placeholder)
+            self.pages.setCurrentIndex(current)
+        finally:
+            self.pages.setUpdatesEnabled(True)
+        placeholder.deleteLater()
+    
+    def build_next_tab(self):
+        """Фоновое построение оставшихся вкладок по одной за итерацию цикла событий"""
+        if not self._tab_builders:
+            return
+        self.build_tab(min(self._tab_builders))
+        if self._tab_builders:
+            QTimer.singleShot(0, self.build_next_tab)
     
     def create_components_tab(self):
         """Вкладка базовых компонентов"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(scroll.NoFrame)
-        
         content = QWidget()
+        apply_scoped_style(content, 'input', 'slider', 'checkbox')
         layout = QVBoxLayout(content)
         layout.setSpacing(24)
         
@@ -239,23 +312,19 @@ class ThemeDemo(QMainWindow):
         spinners_group = QGroupBox("Индикаторы загрузки")
         spinners_layout = QHBoxLayout(spinners_group)
         
-        for size in [16, 24, 32, 48]:
-            spinner = LoadingSpinner(size)
-            spinner.start()
+        # Запускаются только пока вкладка открыта (см. on_tab_changed)
+        self.spinners = [LoadingSpinner(size) for size in [16, 24, 32, 48]]
+        for spinner in self.spinners:
             spinners_layout.addWidget(spinner)
         
         layout.addWidget(spinners_group)
         
-        scroll.setWidget(content)
-        return scroll
+        return content
     
     def create_cards_tab(self):
         """Вкладка с карточками"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(scroll.NoFrame)
-        
         content = QWidget()
+        apply_scoped_style(content, 'slider')
         layout = QVBoxLayout(content)
         layout.setSpacing(24)
         
@@ -301,16 +370,12 @@ class ThemeDemo(QMainWindow):
         
         layout.addLayout(progress_layout)
         
-        scroll.setWidget(content)
-        return scroll
+        return content
     
     def create_forms_tab(self):
         """Вкладка с формами"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(scroll.NoFrame)
-        
         content = QWidget()
+        apply_scoped_style(content, 'input', 'slider', 'checkbox')
         layout = QVBoxLayout(content)
         layout.setSpacing(24)
         
@@ -366,15 +431,10 @@ class ThemeDemo(QMainWindow):
         
         layout.addWidget(settings_card)
         
-        scroll.setWidget(content)
-        return scroll
+        return content
     
     def create_stats_tab(self):
         """Вкладка статистики"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(scroll.NoFrame)
-        
         content = QWidget()
         layout = QVBoxLayout(content)
         layout.setSpacing(24)
@@ -383,16 +443,7 @@ class ThemeDemo(QMainWindow):
         stats_layout = QGridLayout()
         
         # Основная статистика
-        stats_data = [
-            ("Всего кругов", "1,247", "🏁", None),
-            ("Лучший круг", "1:23.456", "⏱️", "#10B981"),
-            ("Средняя скорость", "187 км/ч", "🏎️", "#3B82F6"),
-            ("Время в игре", "142 ч", "⏰", "#F59E0B"),
-            ("Аварий", "23", "💥", "#EF4444"),
-            ("Подиумов", "89", "🏆", "#F59E0B"),
-        ]
-        
-        for i, (title, value, icon, color) in enumerate(stats_data):
+        for i, (title, value, icon, color) in enumerate(_STATS_DATA):
             row = i // 3
             col = i % 3
             
@@ -403,41 +454,12 @@ class ThemeDemo(QMainWindow):
         
         # Дополнительная информация
         info_card = ModernCard("📈 Анализ производительности", "")
-        info_layout = QVBoxLayout()
         
         # Прогресс по категориям
-        categories = [
-            ("Торможение", 85),
-            ("Ускорение", 78),
-            ("Повороты", 92),
-            ("Консистентность", 67),
-        ]
-        
-        for category, progress in categories:
-            cat_layout = QHBoxLayout()
-            cat_layout.addWidget(QLabel(category))
-            cat_layout.addStretch()
-            
-            progress_bar = QProgressBar()
-            progress_bar.setValue(progress)
-            progress_bar.setFixedWidth(200)
-            
-            # Цвет по уровню
-            if progress >= 80:
-                set_widget_style_class(progress_bar, "success")
-            elif progress >= 60:
-                set_widget_style_class(progress_bar, "warning")
-            
-            cat_layout.addWidget(progress_bar)
-            cat_layout.addWidget(QLabel(f"{progress}%"))
-            
-            info_layout.addLayout(cat_layout)
-        
-        info_card.layout().addLayout(info_layout)
+        info_card.layout().addWidget(CategoryBars(_CATEGORIES))
         layout.addWidget(info_card)
         
-        scroll.setWidget(content)
-        return scroll
+        return content
     
     def switch_theme(self, theme_type: ThemeType):
         """Переключение темы"""
@@ -477,17 +499,44 @@ class ThemeDemo(QMainWindow):
         """Показать уведомление"""
         show_notification(message, notification_type, 3000, self)
     
+    # Интервал демо-таймера: окно видно / скрыто или свернуто
+    DEMO_INTERVAL = 2000
+    DEMO_IDLE_INTERVAL = 10_000
+    
     def setup_demo_timer(self):
         """Настройка таймера для демо-эффектов"""
-        self.demo_timer = QTimer()
+        self.demo_timer = QTimer(self)
         self.demo_timer.timeout.connect(self.update_demo_stats)
-        self.demo_timer.start(2000)  # Обновляем каждые 2 секунды
+        self.demo_timer.start(self.DEMO_INTERVAL)
     
     def update_demo_stats(self):
         """Обновление демо-статистики"""
+        # Свернутое или скрытое окно не обновляем
+        if not self.isVisible() or self.windowState() & Qt.WindowMinimized:
+            return
         # Здесь можно добавить анимированные изменения значений
-        pass
-
+    
+    def showEvent(self, event):
+        """Возврат обычного интервала таймера"""
+        super().showEvent(event)
+        self.demo_timer.setInterval(self.DEMO_INTERVAL)
+        
+        # Остальные вкладки достраиваются после первой отрисовки окна
+        if self._tab_builders and not self._tabs_scheduled:
+            self._tabs_scheduled = True
+            QTimer.singleShot(0, self.build_next_tab)
+    
+    def hideEvent(self, event):
+        """Редкие срабатывания таймера, пока окно скрыто"""
+        super().hideEvent(event)
+        self.demo_timer.setInterval(self.DEMO_IDLE_INTERVAL)
+    
+    def changeEvent(self, event):
+        """Смена интервала таймера при сворачивании окна"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            minimized = self.windowState() & Qt.WindowMinimized
+            self.demo_timer.setInterval(self.DEMO_IDLE_INTERVAL if minimized else self.DEMO_INTERVAL)
 
 def main():
     """Главная функция демо"""
@@ -3,13 +3,65 @@
 Вспомогательные функции и компоненты для UI
 """
 
+import weakref
+
+from PyQt5 import sip
 from PyQt5.QtWidgets import (
-    QWidget, QPushButton, QFrame, QLabel, QHBoxLayout, QVBoxLayout,
-    QGraphicsDropShadowEffect, QPropertyAnimation, QEasingCurve
+    QApplication, QWidget, QPushButton, QFrame, QLabel, QHBoxLayout, QVBoxLayout,
+    QGraphicsDropShadowEffect, QGraphicsOpacityEffect
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QEvent, QPoint, QRect, QSize, QPropertyAnimation, QVariantAnimation,
+    QAbstractAnimation, QEasingCurve, pyqtSignal, QTimer
 )
-from PyQt5.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer
-from PyQt5.QtGui import QPainter, QBrush, QColor, QPen, QLinearGradient
-from theme import get_current_theme, set_widget_style_class
+from PyQt5.QtGui import QPainter, QBrush, QColor, QFont, QPen, QLinearGradient, QPixmap, QRegion
+from theme import ModernDarkTheme, get_current_theme, set_widget_style_class, theme_manager
+
+
+# Кеш стилей компонентов: (тема, компонент, вариант) -> стиль
+_STYLE_CACHE = {}
+
+def _cached_stylesheet(component: str, variant, build) -> str:
+    """Стиль компонента для текущей темы (строится один раз на тему и вариант)"""
+    key = (theme_manager.current_theme, component, variant)
+    stylesheet = _STYLE_CACHE.get(key)
+    if stylesheet is None:
+        stylesheet = _STYLE_CACHE[key] = build(get_current_theme(), variant)
+    return stylesheet
+
+
+# Шаблон стиля StatCard для произвольного цвета
+_STAT_CARD_QSS_TEMPLATE = """
+        StatCard {{
+            border: 1px solid {color}40;
+        }}
+        StatCard:hover {{
+            border-color: {color}80;
+        }}
+        QLabel#statIcon, QLabel#statValue {{
+            color: {color};
+        }}
+    """
+
+
+def _build_stat_card_stylesheet(theme, color) -> str:
+    """Стиль StatCard для произвольного цвета (вне вариантов темы)"""
+    return _STAT_CARD_QSS_TEMPLATE.format_map({"color": color})
+
+
+# Цвета теней: (r, g, b, a) или строка цвета -> QColor
+_SHADOW_COLORS = {}
+
+def _configure_shadow(shadow, blur: int, y_offset: int, color):
+    """Настройка тени; QColor для одинаковых параметров создается один раз"""
+    qcolor = _SHADOW_COLORS.get(color)
+    if qcolor is None:
+        qcolor = _SHADOW_COLORS[color] = QColor(*color) if isinstance(color, tuple) else QColor(color)
+    shadow.setBlurRadius(blur)
+    shadow.setXOffset(0)
+    shadow.setYOffset(y_offset)
+    shadow.setColor(qcolor)
+    return shadow
 
 
 class ModernCard(QFrame):
@@ -17,10 +69,12 @@ class ModernCard(QFrame):
     
     clicked = pyqtSignal()
     
+    # Тень рисуется через QGraphicsEffect (отрисовка во внеэкранный буфер при каждом обновлении)
+    shadow_enabled = True
+    
     def __init__(self, title: str = "", subtitle: str = "", clickable: bool = False, parent=None):
         super().__init__(parent)
         self.clickable = clickable
-        self.hover_animation = None
         self.setup_ui(title, subtitle)
         self.setup_effects()
     
@@ -30,6 +84,11 @@ class ModernCard(QFrame):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(12)
+        # Подклассы дополняют этот layout без повторного self.layout()
+        self._content_layout = layout
+        
+        if not title and not subtitle:
+            return
         
         if title:
             title_label = QLabel(title)
@@ -43,39 +102,15 @@ class ModernCard(QFrame):
     
     def setup_effects(self):
         """Настройка эффектов"""
+        self._shadow = None
+        self.hover_animation = None
+        if not self.shadow_enabled:
+            return
+        
         # Тень
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 30))
+        shadow = _configure_shadow(QGraphicsDropShadowEffect(self), 15, 2, (0, 0, 0, 30))
         self.setGraphicsEffect(shadow)
-        
-        # Стили
-        theme = get_current_theme()
-        self.setStyleSheet(f"""
-            ModernCard {{
-                background: {theme.colors['background_secondary']};
-                border: 1px solid {theme.colors['border']};
-                border-radius: {theme.effects['border_radius_xl']};
-                padding: 24px;
-            }}
-            ModernCard:hover {{
-                border-color: {theme.colors['border_light']};
-                background: {theme.colors['background_elevated']};
-            }}
-            QLabel#cardTitle {{
-                color: {theme.colors['text_primary']};
-                font-size: {theme.fonts['size_xl']};
-                font-weight: {theme.fonts['weight_semibold']};
-                margin-bottom: 8px;
-            }}
-            QLabel#cardSubtitle {{
-                color: {theme.colors['text_secondary']};
-                font-size: {theme.fonts['size_base']};
-                line-height: 1.5;
-            }}
-        """)
+        self._shadow = shadow
     
     def enterEvent(self, event):
         """Анимация при наведении"""
@@ -96,33 +131,16 @@ class ModernCard(QFrame):
         super().mousePressEvent(event)
     
     def animate_hover(self, hover: bool):
-        """Анимация наведения"""
-        if self.hover_animation:
-            self.hover_animation.stop()
-        
-        self.hover_animation = QPropertyAnimation(self, b"geometry")
-        self.hover_animation.setDuration(200)
-        self.hover_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        current_geometry = self.geometry()
-        if hover:
-            # Поднимаем карточку
-            new_geometry = QRect(
-                current_geometry.x(),
-                current_geometry.y() - 2,
-                current_geometry.width(),
-                current_geometry.height()
-            )
-        else:
-            # Опускаем карточку
-            new_geometry = QRect(
-                current_geometry.x(),
-                current_geometry.y() + 2,
-                current_geometry.width(),
-                current_geometry.height()
-            )
-        
-        self.hover_animation.setEndValue(new_geometry)
+        """Анимация наведения (размытие тени, без перерасчета геометрии)"""
+        if self._shadow is None:
+            return
+        if self.hover_animation is None:
+            # Создается при первом наведении
+            self.hover_animation = QPropertyAnimation(self._shadow, b"blurRadius", self)
+            self.hover_animation.setDuration(200)
+            self.hover_animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.hover_animation.stop()
+        self.hover_animation.setEndValue(25 if hover else 15)
         self.hover_animation.start()
 
 
@@ -133,6 +151,7 @@ class ModernButton(QPushButton):
         super().__init__(text, parent)
         self.style_class = style_class
         self.press_animation = None
+        self._press_effect = None
         
         if icon:
             self.setIcon(icon)
@@ -147,62 +166,85 @@ class ModernButton(QPushButton):
         # Добавляем эффект нажатия
         self.pressed.connect(self.animate_press)
     
-    def animate_press(self):
-        """Анимация нажатия"""
-        if self.press_animation:
-            self.press_animation.stop()
+    def _ensure_press_animation(self) -> bool:
+        """Эффект и анимация нажатия создаются один раз и переиспользуются"""
+        effect = self.graphicsEffect()
+        if effect is not None:
+            # Эффект уже занят (например, тенью наведения) - хватает стиля :pressed
+            return effect is self._press_effect
         
-        # Создаем анимацию масштабирования
-        self.press_animation = QPropertyAnimation(self, b"geometry")
-        self.press_animation.setDuration(100)
-        self.press_animation.setEasingCurve(QEasingCurve.OutQuad)
+        # Прежний эффект удален Qt при замене - пересоздаем
+        if self.press_animation is not None:
+            self.press_animation.deleteLater()
         
-        # Уменьшаем размер на 2px
-        current = self.geometry()
-        pressed = QRect(
-            current.x() + 1,
-            current.y() + 1,
-            current.width() - 2,
-            current.height() - 2
-        )
-        
-        self.press_animation.setStartValue(current)
-        self.press_animation.setEndValue(pressed)
+        self._press_effect = QGraphicsOpacityEffect(self)
+        # Выключенный эффект не рисует кнопку через внеэкранный буфер
+        self._press_effect.setEnabled(False)
+        self.setGraphicsEffect(self._press_effect)
+        
+        self.press_animation = QPropertyAnimation(self._press_effect, b"opacity", self)
+        self.press_animation.setDuration(200)
+        self.press_animation.setEasingCurve(QEasingCurve.OutQuad)
+        self.press_animation.setStartValue(1.0)
+        self.press_animation.setKeyValueAt(0.5, 0.9)
+        self.press_animation.setEndValue(1.0)
         self.press_animation.finished.connect(self.animate_release)
+        return True
+    
+    def animate_press(self):
+        """Анимация нажатия (прозрачность, без перерасчета геометрии)"""
+        if not self._ensure_press_animation():
+            return
+        
+        self.press_animation.stop()
+        self._press_effect.setEnabled(True)
         self.press_animation.start()
     
     def animate_release(self):
-        """Анимация отпускания"""
-        # Возвращаем исходный размер
-        release_animation = QPropertyAnimation(self, b"geometry")
-        release_animation.setDuration(100)
-        release_animation.setEasingCurve(QEasingCurve.OutBounce)
-        
-        current = self.geometry()
-        released = QRect(
-            current.x() - 1,
-            current.y() - 1,
-            current.width() + 2,
-            current.height() + 2
-        )
-        
-        release_animation.setStartValue(current)
-        release_animation.setEndValue(released)
-        release_animation.start()
+        """Завершение анимации нажатия"""
+        self._press_effect.setEnabled(False)
 
 
 class LoadingSpinner(QWidget):
     """Спиннер загрузки"""
     
+    # Оборот за секунду; угол квантуется шагом 12° (~30 перерисовок в секунду)
+    ROTATION_PERIOD = 1000
+    ANGLE_STEP = 12
+    
+    # Общая анимация для всех активных спиннеров и ее текущий угол
+    _driver = None
+    _phase = 0
+    # Слабые ссылки: анимация не удерживает выброшенные спиннеры
+    _active = weakref.WeakSet()
+    
+    # Отрисованные колеса: (размер, цвет, масштаб экрана) -> QPixmap
+    _pixmap_cache = {}
+    # Таблицы цветов сегментов: цвет -> список QColor
+    _color_tables = {}
+    
     def __init__(self, size: int = 24, parent=None):
         super().__init__(parent)
         self.size = size
         self.angle = 0
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_rotation)
+        self._running = False
         
         self.setFixedSize(size, size)
+        self._ring_region = self._build_ring_region(size)
         self.setup_style()
+        theme_manager.theme_changed.connect(self.on_theme_changed)
+    
+    @staticmethod
+    def _build_ring_region(size: int) -> QRegion:
+        """Кольцо, в котором лежат сегменты (с запасом на толщину пера и сглаживание)"""
+        center = size // 2
+        radius = center - 2
+        outer = radius + 2
+        inner = max(radius - 3, 0)
+        ring = QRegion(center - outer, center - outer, outer * 2, outer * 2, QRegion.Ellipse)
+        if inner:
+            ring = ring.subtracted(QRegion(center - inner, center - inner, inner * 2, inner * 2, QRegion.Ellipse))
+        return ring
     
     def setup_style(self):
         """Настройка стилей"""
@@ -210,54 +252,155 @@ class LoadingSpinner(QWidget):
         self.primary_color = QColor(theme.colors['accent'])
         self.secondary_color = QColor(theme.colors['border'])
     
+    def on_theme_changed(self, theme_name: str):
+        """Перекраска спиннера под новую тему"""
+        self.setup_style()
+        self.update()
+    
     def start(self):
         """Запуск анимации"""
-        self.timer.start(16)  # ~60 FPS
+        self._running = True
+        if self.isVisible():
+            self._attach_driver()
     
     def stop(self):
         """Остановка анимации"""
-        self.timer.stop()
+        self._running = False
+        self._detach_driver()
+    
+    def _attach_driver(self):
+        """Подключение к общей анимации"""
+        cls = LoadingSpinner
+        cls._active.add(self)
+        if cls._live_driver() is None:
+            # Анимация идет по часам Qt и пропускает кадры, если поток GUI занят
+            cls._driver = QVariantAnimation()
+            cls._driver.setStartValue(0)
+            cls._driver.setEndValue(360)
+            cls._driver.setDuration(cls.ROTATION_PERIOD)
+            cls._driver.setLoopCount(-1)
+            cls._driver.valueChanged.connect(cls._tick)
+        if cls._driver.state() != QAbstractAnimation.Running:
+            cls._driver.start()
+    
+    def _detach_driver(self):
+        """Отключение от общей анимации"""
+        cls = LoadingSpinner
+        cls._active.discard(self)
+        driver = cls._live_driver()
+        if not cls._active and driver is not None:
+            driver.stop()
+    
+    @classmethod
+    def _live_driver(cls):
+        """Общая анимация, если Qt ее еще не удалил (при завершении приложения)"""
+        if cls._driver is not None and sip.isdeleted(cls._driver):
+            cls._driver = None
+        return cls._driver
+    
+    def showEvent(self, event):
+        """Продолжение анимации при появлении"""
+        super().showEvent(event)
+        if self._running:
+            self._attach_driver()
+    
+    def hideEvent(self, event):
+        """Пауза анимации, пока спиннер скрыт"""
+        self._detach_driver()
+        super().hideEvent(event)
     
-    def update_rotation(self):
+    @classmethod
+    def _tick(cls, value):
+        """Один шаг анимации для всех активных спиннеров"""
+        angle = int(value) // cls.ANGLE_STEP * cls.ANGLE_STEP % 360
+        if angle == cls._phase:
+            return
+        cls._phase = angle
+        for spinner in list(cls._active):
+            try:
+                spinner.update_rotation(angle)
+            except RuntimeError:
+                # Виджет уже удален Qt
+                cls._active.discard(spinner)
+        driver = cls._live_driver()
+        if not cls._active and driver is not None:
+            driver.stop()
+    
+    def update_rotation(self, angle: int):
         """Обновление поворота"""
-        self.angle = (self.angle + 6) % 360
-        self.update()
+        # Полностью перекрытый спиннер не перерисовываем
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
+        self.angle = angle
+        # При вращении меняется только кольцо - центр и углы виджета не перерисовываем
+        self.update(self._ring_region)
     
-    def paintEvent(self, event):
-        """Отрисовка спиннера"""
-        painter = QPainter(self)
+    @classmethod
+    def _segment_colors(cls, color: QColor) -> list:
+        """Цвета сегментов: прозрачность зависит от позиции (одна таблица на цвет)"""
+        key = color.rgba()
+        colors = cls._color_tables.get(key)
+        if colors is None:
+            red, green, blue = color.red(), color.green(), color.blue()
+            colors = cls._color_tables[key] = [QColor(red, green, blue, int(255 * (i / 12))) for i in range(12)]
+        return colors
+    
+    def _wheel_pixmap(self, size: int) -> QPixmap:
+        """Колесо из 12 сегментов (рисуется один раз на размер, цвет и масштаб экрана)"""
+        ratio = self.devicePixelRatioF()
+        key = (size, self.primary_color.rgba(), ratio)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is not None:
+            return pixmap
+        
+        # Разрешение экрана, на котором показан спиннер (HiDPI без лишней памяти на обычных)
+        side = int(round(size * ratio))
+        pixmap = QPixmap(side, side)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
+        # Сегменты не перекрываются, а буфер прозрачный - смешивание не нужно
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
         
-        # Центр
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-        radius = min(center_x, center_y) - 2
+        center = size // 2
+        radius = center - 2
         
-        # Рисуем круговые сегменты
         pen = QPen()
         pen.setWidth(2)
         pen.setCapStyle(Qt.RoundCap)
         
-        for i in range(12):
-            angle = (self.angle + i * 30) % 360
-            
-            # Прозрачность зависит от позиции
-            alpha = int(255 * (i / 12))
-            color = QColor(self.primary_color)
-            color.setAlpha(alpha)
-            
-            pen.setColor(color)
+        for i, segment_color in enumerate(self._segment_colors(self.primary_color)):
+            pen.setColor(segment_color)
             painter.setPen(pen)
             
-            # Рассчитываем координаты
-            start_angle = angle * 16  # Qt использует 1/16 градуса
-            span_angle = 20 * 16
-            
+            # Qt использует 1/16 градуса
             painter.drawArc(
-                center_x - radius, center_y - radius,
+                center - radius, center - radius,
                 radius * 2, radius * 2,
-                start_angle, span_angle
+                i * 30 * 16, 20 * 16
             )
+        painter.end()
+        
+        self._pixmap_cache[key] = pixmap
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Отрисовка спиннера"""
+        pixmap = self._wheel_pixmap(self.width())
+        center = self.width() // 2
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.translate(center, center)
+        # drawArc отсчитывает углы против часовой стрелки, rotate - по часовой
+        painter.rotate(-self.angle)
+        painter.drawPixmap(-center, -center, pixmap)
+
+
+# Кэш колес спиннера сбрасывается при смене темы
+theme_manager.theme_changed.connect(lambda _name: LoadingSpinner._pixmap_cache.clear())
 
 
 class ProgressCard(ModernCard):
@@ -275,9 +418,10 @@ class ProgressCard(ModernCard):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(int(self.progress_value))
-        set_widget_style_class(self.progress_bar, "modern")
+        # Прогресс-бар еще не отполирован - перестилизация не нужна
+        self.progress_bar.setProperty("styleClass", "modern")
         
-        self.layout().addWidget(self.progress_bar)
+        self._content_layout.addWidget(self.progress_bar)
     
     def set_progress(self, value: float):
         """Установка прогресса"""
@@ -288,17 +432,16 @@ class ProgressCard(ModernCard):
 class StatCard(ModernCard):
     """Карточка статистики"""
     
+    # Карточки статистики выводятся сеткой - без теней
+    shadow_enabled = False
+    
     def __init__(self, title: str, value: str, icon: str = "", color: str = None, parent=None):
         super().__init__("", "", parent=parent)
         self.setup_stat_ui(title, value, icon, color)
     
     def setup_stat_ui(self, title: str, value: str, icon: str, color: str):
         """Настройка интерфейса статистики"""
-        theme = get_current_theme()
-        stat_color = color or theme.colors['accent']
-        
-        # Очищаем layout
-        layout = self.layout()
+        layout = self._content_layout
         
         # Заголовок с иконкой
         header_layout = QHBoxLayout()
@@ -321,36 +464,116 @@ class StatCard(ModernCard):
         title_label.setObjectName("statTitle")
         layout.addWidget(title_label)
         
-        # Стили
-        self.setStyleSheet(f"""
-            StatCard {{
-                background: {theme.colors['background_secondary']};
-                border: 1px solid {stat_color}40;
-                border-radius: {theme.effects['border_radius_xl']};
-            }}
-            StatCard:hover {{
-                border-color: {stat_color}80;
-                background: {theme.colors['background_elevated']};
-            }}
-            QLabel#statIcon {{
-                color: {stat_color};
-                font-size: {theme.fonts['size_3xl']};
-                font-weight: {theme.fonts['weight_bold']};
-            }}
-            QLabel#statValue {{
-                color: {stat_color};
-                font-size: {theme.fonts['size_4xl']};
-                font-weight: {theme.fonts['weight_black']};
-                margin: 8px 0;
-            }}
-            QLabel#statTitle {{
-                color: {theme.colors['text_muted']};
-                font-size: {theme.fonts['size_sm']};
-                font-weight: {theme.fonts['weight_medium']};
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }}
-        """)
+        # Стили: варианты темы заданы в общем стиле приложения
+        if color is None or color in ModernDarkTheme.STAT_VARIANTS:
+            # Виджет еще не отполирован - перестилизация не нужна
+            self.setProperty("styleClass", color or "accent")
+        else:
+            self.setStyleSheet(_cached_stylesheet("stat", color, _build_stat_card_stylesheet))
+
+
+class CategoryBars(QWidget):
+    """Полосы прогресса по категориям, рисуемые одним виджетом"""
+    
+    ROW_HEIGHT = 28
+    ROW_SPACING = 8
+    BAR_WIDTH = 200
+    VALUE_WIDTH = 48
+    
+    def __init__(self, categories, parent=None):
+        super().__init__(parent)
+        self.categories = tuple(categories)
+        self.setMinimumHeight(self._content_height())
+        theme_manager.theme_changed.connect(self.on_theme_changed)
+    
+    def _content_height(self) -> int:
+        """Высота всех строк"""
+        rows = len(self.categories)
+        return rows * self.ROW_HEIGHT + max(rows - 1, 0) * self.ROW_SPACING
+    
+    def sizeHint(self) -> QSize:
+        """Предпочтительный размер"""
+        return QSize(480, self._content_height())
+    
+    def on_theme_changed(self, theme_name: str):
+        """Перерисовка в цветах новой темы"""
+        self.update()
+    
+    def paintEvent(self, event):
+        """Отрисовка всех строк за один проход"""
+        theme = get_current_theme()
+        text_color = theme.get_qcolor('text_primary')
+        track_color = theme.get_qcolor('background_tertiary')
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        bar_x = self.width() - self.VALUE_WIDTH - self.BAR_WIDTH
+        for row, (category, progress) in enumerate(self.categories):
+            y = row * (self.ROW_HEIGHT + self.ROW_SPACING)
+            
+            # Название категории
+            painter.setPen(text_color)
+            painter.drawText(QRect(0, y, bar_x - 8, self.ROW_HEIGHT), Qt.AlignLeft | Qt.AlignVCenter, category)
+            
+            # Фон полосы
+            bar_rect = QRect(bar_x, y + 4, self.BAR_WIDTH, self.ROW_HEIGHT - 8)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(track_color)
+            painter.drawRoundedRect(bar_rect, 6, 6)
+            
+            # Заполнение: цвет по уровню
+            if progress >= 80:
+                fill_color = theme.get_qcolor('success')
+            elif progress >= 60:
+                fill_color = theme.get_qcolor('warning')
+            else:
+                fill_color = theme.get_qcolor('accent')
+            fill_rect = bar_rect.adjusted(2, 2, -2, -2)
+            fill_rect.setWidth(int(fill_rect.width() * progress / 100))
+            painter.setBrush(fill_color)
+            painter.drawRoundedRect(fill_rect, 4, 4)
+            
+            # Значение
+            painter.setPen(text_color)
+            painter.drawText(
+                QRect(bar_x + self.BAR_WIDTH, y, self.VALUE_WIDTH, self.ROW_HEIGHT),
+                Qt.AlignRight | Qt.AlignVCenter, f"{progress}%"
+            )
+
+
+# Иконки по типу уведомления
+_TOAST_ICONS = {
+    "success": "✅",
+    "error": "❌",
+    "warning": "⚠️",
+    "info": "ℹ️",
+}
+
+# Иконки, отрисованные в QPixmap: символ -> QPixmap
+_TOAST_ICON_SIZE = 24
+_TOAST_ICON_PIXMAPS = {}
+
+def _toast_icon_pixmap(notification_type: str) -> QPixmap:
+    """Иконка уведомления (эмодзи раскладывается и рисуется один раз)"""
+    icon = _TOAST_ICONS.get(notification_type, "ℹ️")
+    pixmap = _TOAST_ICON_PIXMAPS.get(icon)
+    if pixmap is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        side = int(round(_TOAST_ICON_SIZE * ratio))
+        pixmap = QPixmap(side, side)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPixelSize(18)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, _TOAST_ICON_SIZE, _TOAST_ICON_SIZE), Qt.AlignCenter, icon)
+        painter.end()
+        
+        _TOAST_ICON_PIXMAPS[icon] = pixmap
+    return pixmap
 
 
 class NotificationToast(QWidget):
@@ -360,35 +583,36 @@ class NotificationToast(QWidget):
         super().__init__(parent)
         self.notification_type = notification_type
         self.duration = duration
+        self.fade_in = None
         self.setup_ui(message)
-        self.setup_animations()
     
     def setup_ui(self, message: str):
         """Настройка интерфейса"""
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-        layout = QHBoxLayout(self)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Внутренний контейнер: на нем эффект прозрачности для анимаций
+        self._container = QFrame()
+        self._container.setObjectName("toastBody")
+        outer_layout.addWidget(self._container)
+        
+        layout = QHBoxLayout(self._container)
         layout.setContentsMargins(20, 16, 20, 16)
         layout.setSpacing(12)
         
         # Иконка
-        icon_map = {
-            "success": "✅",
-            "error": "❌", 
-            "warning": "⚠️",
-            "info": "ℹ️"
-        }
-        
-        icon_label = QLabel(icon_map.get(self.notification_type, "ℹ️"))
-        icon_label.setObjectName("toastIcon")
+        icon_label = QLabel()
+        icon_label.setPixmap(_toast_icon_pixmap(self.notification_type))
         layout.addWidget(icon_label)
         
         # Сообщение
-        message_label = QLabel(message)
-        message_label.setObjectName("toastMessage")
-        message_label.setWordWrap(True)
-        layout.addWidget(message_label)
+        self.message_label = QLabel(message)
+        self.message_label.setObjectName("toastMessage")
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.message_label)
         
         # Кнопка закрытия
         close_btn = QPushButton("×")
@@ -399,67 +623,34 @@ class NotificationToast(QWidget):
         self.setup_style()
     
     def setup_style(self):
-        """Настройка стилей"""
-        theme = get_current_theme()
-        
-        # Цвета по типу уведомления
-        color_map = {
-            "success": theme.colors['success'],
-            "error": theme.colors['error'],
-            "warning": theme.colors['warning'],
-            "info": theme.colors['info']
-        }
-        
-        accent_color = color_map.get(self.notification_type, theme.colors['info'])
-        
-        self.setStyleSheet(f"""
-            NotificationToast {{
-                background: {theme.colors['background_modal']};
-                border: 1px solid {accent_color};
-                border-radius: {theme.effects['border_radius_lg']};
-                box-shadow: {theme.effects['shadow_xl']};
-            }}
-            QLabel#toastIcon {{
-                font-size: {theme.fonts['size_xl']};
-                color: {accent_color};
-            }}
-            QLabel#toastMessage {{
-                color: {theme.colors['text_primary']};
-                font-size: {theme.fonts['size_base']};
-                font-weight: {theme.fonts['weight_medium']};
-            }}
-            QPushButton#toastClose {{
-                background: transparent;
-                border: none;
-                color: {theme.colors['text_muted']};
-                font-size: {theme.fonts['size_xl']};
-                font-weight: {theme.fonts['weight_bold']};
-                width: 24px;
-                height: 24px;
-                border-radius: 12px;
-            }}
-            QPushButton#toastClose:hover {{
-                background: {theme.colors['background_tertiary']};
-                color: {theme.colors['text_primary']};
-            }}
-        """)
+        """Настройка стилей (цвета типов заданы в общем стиле приложения)"""
+        variant = self.notification_type
+        if variant not in ModernDarkTheme.TOAST_VARIANTS:
+            variant = "info"
+        # Виджет еще не отполирован - перестилизация не нужна
+        self.setProperty("styleClass", variant)
     
     def setup_animations(self):
-        """Настройка анимаций"""
+        """Настройка анимаций (при первом показе)"""
+        # Прозрачность содержимого вместо windowOpacity (без перерисовки окна композитором)
+        self.opacity_effect = QGraphicsOpacityEffect(self._container)
+        self._container.setGraphicsEffect(self.opacity_effect)
+        
         # Анимация появления
-        self.fade_in = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_in = QPropertyAnimation(self.opacity_effect, b"opacity", self)
         self.fade_in.setDuration(300)
         self.fade_in.setStartValue(0.0)
         self.fade_in.setEndValue(1.0)
         self.fade_in.setEasingCurve(QEasingCurve.OutCubic)
+        self.fade_in.finished.connect(self._on_faded_in)
         
         # Анимация исчезновения
-        self.fade_out = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_out = QPropertyAnimation(self.opacity_effect, b"opacity", self)
         self.fade_out.setDuration(300)
         self.fade_out.setStartValue(1.0)
         self.fade_out.setEndValue(0.0)
         self.fade_out.setEasingCurve(QEasingCurve.InCubic)
-        self.fade_out.finished.connect(self.close)
+        self.fade_out.finished.connect(self._on_faded_out)
         
         # Таймер автоскрытия
         self.auto_hide_timer = QTimer()
@@ -468,6 +659,9 @@ class NotificationToast(QWidget):
     
     def show_toast(self, parent_widget=None):
         """Показать уведомление"""
+        if self.fade_in is None:
+            self.setup_animations()
+        
         if parent_widget:
             # Позиционируем относительно родительского виджета
             parent_rect = parent_widget.geometry()
@@ -476,6 +670,7 @@ class NotificationToast(QWidget):
                 parent_rect.top() + 20
             )
         
+        self.opacity_effect.setEnabled(True)
         self.show()
         self.fade_in.start()
         
@@ -484,8 +679,30 @@ class NotificationToast(QWidget):
     
     def hide_toast(self):
         """Скрыть уведомление"""
+        if self.fade_in is None:
+            self.hide()
+            return
         self.auto_hide_timer.stop()
+        self.fade_in.stop()
+        self.opacity_effect.setEnabled(True)
         self.fade_out.start()
+    
+    def reset(self, message: str, duration: int):
+        """Подготовка тоста из пула к повторному показу"""
+        if self.fade_in is not None:
+            self.fade_out.stop()
+        self.duration = duration
+        self.message_label.setText(message)
+        self.adjustSize()
+    
+    def _on_faded_in(self):
+        """Полностью видимый тост рисуется без внеэкранного буфера"""
+        self.opacity_effect.setEnabled(False)
+    
+    def _on_faded_out(self):
+        """Скрытие и возврат в пул"""
+        self.hide()
+        _release_toast(self)
 
 
 class GlassPanel(QFrame):
@@ -497,24 +714,8 @@ class GlassPanel(QFrame):
     
     def setup_style(self):
         """Настройка стеклянного эффекта"""
-        theme = get_current_theme()
-        
-        self.setStyleSheet(f"""
-            GlassPanel {{
-                background: {theme.colors['glass']};
-                border: 1px solid {theme.colors['border_light']};
-                border-radius: {theme.effects['border_radius_xl']};
-                backdrop-filter: {theme.effects['blur_md']};
-            }}
-        """)
-        
         # Добавляем тень
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(25)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        self.setGraphicsEffect(shadow)
+        self.setGraphicsEffect(_configure_shadow(QGraphicsDropShadowEffect(self), 25, 4, (0, 0, 0, 40)))
 
 
 class ModernSlider(QWidget):
@@ -559,29 +760,6 @@ class ModernSlider(QWidget):
         self.slider.valueChanged.connect(self.on_value_changed)
         
         layout.addWidget(self.slider)
-        
-        self.setup_style()
-    
-    def setup_style(self):
-        """Настройка стилей"""
-        theme = get_current_theme()
-        
-        self.setStyleSheet(f"""
-            QLabel#sliderLabel {{
-                color: {theme.colors['text_secondary']};
-                font-size: {theme.fonts['size_base']};
-                font-weight: {theme.fonts['weight_medium']};
-            }}
-            QLabel#sliderValue {{
-                color: {theme.colors['accent']};
-                font-size: {theme.fonts['size_lg']};
-                font-weight: {theme.fonts['weight_semibold']};
-                background: {theme.colors['background_secondary']};
-                border-radius: {theme.effects['border_radius_sm']};
-                padding: 6px 12px;
-                border: 1px solid {theme.colors['border']};
-            }}
-        """)
     
     def on_value_changed(self, value: int):
         """Обработка изменения значения"""
@@ -597,6 +775,16 @@ class ModernSlider(QWidget):
         self.slider.setValue(value)
 
 
+def _build_icon_button_stylesheet(theme, size) -> str:
+    """Размеры IconButton (цвета заданы в общем стиле приложения)"""
+    return f"""
+        IconButton {{
+            border-radius: {size // 2}px;
+            font-size: {size // 2}px;
+        }}
+    """
+
+
 class IconButton(QPushButton):
     """Кнопка только с иконкой"""
     
@@ -608,30 +796,11 @@ class IconButton(QPushButton):
     
     def setup_style(self):
         """Настройка стилей"""
-        theme = get_current_theme()
-        
         self.setText(self.icon_text)
         self.setFixedSize(self.button_size, self.button_size)
         self.setCursor(Qt.PointingHandCursor)
         
-        self.setStyleSheet(f"""
-            IconButton {{
-                background: transparent;
-                border: none;
-                border-radius: {self.button_size // 2}px;
-                color: {theme.colors['text_secondary']};
-                font-size: {self.button_size // 2}px;
-                font-weight: {theme.fonts['weight_bold']};
-            }}
-            IconButton:hover {{
-                background: {theme.colors['background_secondary']};
-                color: {theme.colors['text_primary']};
-            }}
-            IconButton:pressed {{
-                background: {theme.colors['accent']};
-                color: white;
-            }}
-        """)
+        self.setStyleSheet(_cached_stylesheet("icon_button", self.button_size, _build_icon_button_stylesheet))
 
 
 class ModernDialog(QWidget):
@@ -641,12 +810,20 @@ class ModernDialog(QWidget):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.fade_in = None
         self.setup_ui(title)
-        self.setup_animations()
     
     def setup_ui(self, title: str):
         """Настройка интерфейса"""
-        main_layout = QVBoxLayout(self)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Внутренний контейнер: на нем эффект прозрачности для анимаций
+        # (у самой панели уже есть эффект тени)
+        self._container = QWidget()
+        outer_layout.addWidget(self._container)
+        
+        main_layout = QVBoxLayout(self._container)
         main_layout.setContentsMargins(20, 20, 20, 20)
         
         # Основная панель
@@ -676,55 +853,88 @@ class ModernDialog(QWidget):
         panel_layout.addLayout(self.content_layout)
         
         main_layout.addWidget(self.main_panel)
-        
-        self.setup_style()
-    
-    def setup_style(self):
-        """Настройка стилей"""
-        theme = get_current_theme()
-        
-        self.setStyleSheet(f"""
-            QLabel#dialogTitle {{
-                color: {theme.colors['text_primary']};
-                font-size: {theme.fonts['size_2xl']};
-                font-weight: {theme.fonts['weight_semibold']};
-            }}
-        """)
     
     def setup_animations(self):
-        """Настройка анимаций"""
-        # Анимация появления
-        self.scale_in = QPropertyAnimation(self.main_panel, b"geometry")
-        self.scale_in.setDuration(300)
-        self.scale_in.setEasingCurve(QEasingCurve.OutBack)
+        """Настройка анимаций (при первом показе)"""
+        # Анимация появления: сдвиг окна (pos), без перерасчета раскладки панели
+        self.slide_in = QPropertyAnimation(self, b"pos")
+        self.slide_in.setDuration(300)
+        self.slide_in.setEasingCurve(QEasingCurve.OutCubic)
         
-        self.fade_in = QPropertyAnimation(self, b"windowOpacity")
+        self.opacity_effect = QGraphicsOpacityEffect(self._container)
+        self._container.setGraphicsEffect(self.opacity_effect)
+        
+        self.fade_in = QPropertyAnimation(self.opacity_effect, b"opacity", self)
         self.fade_in.setDuration(300)
         self.fade_in.setStartValue(0.0)
         self.fade_in.setEndValue(1.0)
+        self.fade_in.finished.connect(self._on_faded_in)
+    
+    def _on_faded_in(self):
+        """Полностью видимый диалог рисуется без внеэкранного буфера"""
+        self.opacity_effect.setEnabled(False)
     
     def showEvent(self, event):
         """Событие показа"""
         super().showEvent(event)
+        if self.fade_in is None:
+            self.setup_animations()
         
         # Центрируем диалог
         if self.parent():
             parent_rect = self.parent().geometry()
-            self.move(
+            target = QPoint(
                 parent_rect.center().x() - self.width() // 2,
                 parent_rect.center().y() - self.height() // 2
             )
+            self.move(target)
+            self.slide_in.setStartValue(target + QPoint(0, 16))
+            self.slide_in.setEndValue(target)
+            self.slide_in.start()
         
         # Запускаем анимации
+        self.opacity_effect.setEnabled(True)
         self.fade_in.start()
 
 
 # Вспомогательные функции
 
+# Скрытые тосты для повторного использования: тип -> список
+_TOAST_POOL = {}
+_TOAST_POOL_SIZE = 3
+
+def _acquire_toast(notification_type: str, parent):
+    """Тост из пула с тем же типом и родителем"""
+    pool = _TOAST_POOL.get(notification_type)
+    while pool:
+        toast = pool.pop()
+        try:
+            if toast.parent() is parent:
+                return toast
+            toast.deleteLater()
+        except RuntimeError:
+            # C++ объект уже удален вместе с родителем
+            continue
+    return None
+
+def _release_toast(toast: NotificationToast):
+    """Возврат скрытого тоста в пул (лишние удаляются)"""
+    pool = _TOAST_POOL.setdefault(toast.notification_type, [])
+    if toast in pool:
+        return
+    if len(pool) < _TOAST_POOL_SIZE:
+        pool.append(toast)
+    else:
+        toast.deleteLater()
+
 def show_notification(message: str, notification_type: str = "info", 
                      duration: int = 3000, parent=None):
     """Показать уведомление"""
-    toast = NotificationToast(message, notification_type, duration, parent)
+    toast = _acquire_toast(notification_type, parent)
+    if toast is None:
+        toast = NotificationToast(message, notification_type, duration, parent)
+    else:
+        toast.reset(message, duration)
     toast.show_toast(parent)
     return toast
 
@@ -754,36 +964,87 @@ def apply_glow_effect(widget: QWidget, color: str = None, blur: int = 20):
     theme = get_current_theme()
     glow_color = color or theme.colors['accent']
     
-    glow = QGraphicsDropShadowEffect()
-    glow.setBlurRadius(blur)
-    glow.setXOffset(0)
-    glow.setYOffset(0)
-    glow.setColor(QColor(glow_color))
+    # Уже установленная тень перенастраивается, а не создается заново
+    glow = widget.graphicsEffect()
+    if not isinstance(glow, QGraphicsDropShadowEffect) or glow.objectName() == "hoverLift":
+        glow = QGraphicsDropShadowEffect(widget)
+        widget.setGraphicsEffect(glow)
+    _configure_shadow(glow, blur, 0, glow_color)
+
+class _HoverLiftFilter(QObject):
+    """Фильтр событий: тень под виджетом только пока над ним курсор"""
     
-    widget.setGraphicsEffect(glow)
+    def eventFilter(self, widget, event):
+        if event.type() == QEvent.Enter:
+            shadow = widget.graphicsEffect()
+            if shadow is None or shadow.objectName() != "hoverLift":
+                # Тень создается один раз на виджет, дальше только включается
+                shadow = _configure_shadow(QGraphicsDropShadowEffect(widget), 10, 4, (0, 0, 0, 80))
+                shadow.setObjectName("hoverLift")
+                widget.setGraphicsEffect(shadow)
+            shadow.setEnabled(True)
+        elif event.type() == QEvent.Leave:
+            shadow = widget.graphicsEffect()
+            if shadow is not None and shadow.objectName() == "hoverLift":
+                # Выключенный эффект не рисует виджет через внеэкранный буфер
+                shadow.setEnabled(False)
+        return False
+
+
+_hover_lift_filter = None
+
+def attach_hover_lift(widget: QWidget):
+    """Эффект подъема при наведении (замена box-shadow, который Qt игнорирует)"""
+    global _hover_lift_filter
+    if _hover_lift_filter is None:
+        _hover_lift_filter = _HoverLiftFilter()
+    widget.installEventFilter(_hover_lift_filter)
+
+def _center_loading_spinner(widget: QWidget):
+    """Спиннер загрузки по центру виджета"""
+    spinner = widget._loading_spinner
+    spinner.move(
+        (widget.width() - spinner.width()) // 2,
+        (widget.height() - spinner.height()) // 2
+    )
+
+
+class _LoadingSpinnerFilter(QObject):
+    """Фильтр событий: спиннер загрузки остается по центру при изменении размера"""
+    
+    def eventFilter(self, widget, event):
+        if event.type() == QEvent.Resize and widget._loading_spinner.isVisible():
+            _center_loading_spinner(widget)
+        return False
+
+
+_loading_spinner_filter = None
 
 def set_loading_state(widget: QWidget, loading: bool = True):
     """Установить состояние загрузки для виджета"""
+    global _loading_spinner_filter
     if loading:
         widget.setEnabled(False)
-        # Добавляем спиннер (если нужно)
+        # Спиннер создается при первой загрузке и дальше переиспользуется
         if not hasattr(widget, '_loading_spinner'):
             widget._loading_spinner = LoadingSpinner(parent=widget)
-            widget._loading_spinner.move(
-                widget.width() // 2 - 12,
-                widget.height() // 2 - 12
-            )
+            if _loading_spinner_filter is None:
+                _loading_spinner_filter = _LoadingSpinnerFilter()
+            widget.installEventFilter(_loading_spinner_filter)
+        _center_loading_spinner(widget)
         widget._loading_spinner.show()
         widget._loading_spinner.start()
     else:
         widget.setEnabled(True)
         if hasattr(widget, '_loading_spinner'):
+            # Скрытый и остановленный спиннер не получает кадров анимации
             widget._loading_spinner.stop()
             widget._loading_spinner.hide()
 
 # Экспорт компонентов
 __all__ = [
-    'ModernCard', 'ModernButton', 'LoadingSpinner', 'ProgressCard', 'StatCard',
+    'ModernCard', 'ModernButton', 'LoadingSpinner', 'ProgressCard', 'StatCard', 'CategoryBars',
     'NotificationToast', 'GlassPanel', 'ModernSlider', 'IconButton', 'ModernDialog',
-    'show_notification', 'create_separator', 'apply_glow_effect', 'set_loading_state'
+    'show_notification', 'create_separator', 'apply_glow_effect', 'attach_hover_lift',
+    'set_loading_state'
 ]
@@ -1,146 +1,422 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 from core.setupexpert import SetupExpert
 from core.exceptions import FileError, ValidationError
-import json
+import logging
+from functools import lru_cache
 from pathlib import Path
 
+# Файл данных Setup Expert
+_DATA_FILE = Path("data/lmu_data.json")
+
+# Разметка карточки статистики (подстановка через format_map)
+_STAT_CARD_HTML = (
+    "<div style='font-size: 16px;'>{icon}</div>"
+    "<div style='font-size: 16px; font-weight: bold;'>{value}</div>"
+    "<div style='font-size: 10px;'>{label}</div>"
+)
+
+# Варианты погоды: подпись в списке и ключ, хранимый в данных элемента
+_WEATHER_OPTIONS = (
+    ("☀️ Sunny", "sunny"),
+    ("⛅ Partly Cloudy", "partly_cloudy"),
+    ("🌧️ Rain", "rain"),
+    ("⛈️ Storm", "storm"),
+)
+
+_WET_WEATHER = frozenset(("rain", "storm"))
+
+# Неизменяемые тексты панели результатов
+_WELCOME_TEXT = """
+🚀 Welcome to Setup Expert!
+
+Follow these steps to optimize your car setup:
+
+1️⃣ Select your vehicle and track
+2️⃣ Configure race conditions (temperature, weather, time)
+3️⃣ Click 'Analyze Setup' for AI-powered recommendations
+
+The system will analyze:
+• Track characteristics and layout
+• Weather impact on aerodynamics
+• Temperature effects on tire performance
+• Optimal gear ratios and suspension settings
+
+🎯 Get ready for faster lap times and better consistency!
+        """
+
+_PROGRESS_TEXT = """
+🔬 ANALYZING SETUP...
+
+⚡ Processing track data...
+🧠 Running AI optimization algorithms...
+📊 Calculating optimal parameters...
+🎯 Generating recommendations...
+
+Please wait while we optimize your setup for maximum performance!
+        """
+
+_WET_ADJUSTMENTS_TEXT = """
+▲ Front Wing: +2.5 (increased downforce for wet conditions)
+▲ Rear Wing: +1.8 (better stability in rain)
+▼ Tire Pressure: -1.2 PSI (larger contact patch)
+▲ Ride Height: +5mm (avoid aquaplaning)
+◀ Brake Bias: -3% (prevent rear lockup)
+"""
+
+_DRY_ADJUSTMENTS_TEXT = """
+▼ Front Wing: -1.2 (reduced drag for better top speed)
+▲ Rear Wing: +0.8 (balance aerodynamics)
+▲ Tire Pressure: +0.5 PSI (optimal temperature management)
+▼ Suspension: -5% stiffness (better mechanical grip)
+▶ Brake Bias: +2% (improved braking efficiency)
+"""
+
+_RESULTS_FOOTER_TEXT = """
+
+💡 EXPERT INSIGHTS
+═══════════════════════════════════════
+• Setup optimized for current weather conditions
+• Aerodynamics balanced for this track layout
+• Suspension tuned for optimal tire wear
+• Brake balance adjusted for driver confidence
+
+🎯 PERFORMANCE PREDICTION
+═══════════════════════════════════════
+Expected lap time improvement: 0.8-1.2 seconds
+Tire degradation: Reduced by 15%
+Confidence level: 92%
+
+🏆 Ready to hit the track with your optimized setup!
+        """
+
+
+@lru_cache(maxsize=64)
+def _build_results_text(car, track, temperature, weather, time_of_day, wet):
+    """Текст отчета (чистая функция входных условий - повторный выбор берется из кэша)"""
+    parts = [f"""
+✅ SETUP ANALYSIS COMPLETE
+
+🏁 CONFIGURATION
+═══════════════════════════════════════
+🏎️ Car: {car}
+🗺️ Track: {track}
+🌡️ Temperature: {temperature}°C
+☁️ Weather: {weather}
+🕐 Time: {time_of_day}
+
+🔧 RECOMMENDED ADJUSTMENTS
+═══════════════════════════════════════
+"""]
+    
+    # Генерируем рекомендации на основе условий
+    if wet:
+        parts.append(_WET_ADJUSTMENTS_TEXT)
+    else:
+        parts.append(_DRY_ADJUSTMENTS_TEXT)
+    
+    if temperature > 35:
+        parts.append("🔥 Cooling: Increase radiator opening (+15%)\n")
+    elif temperature < 15:
+        parts.append("❄️ Warm-up: Tire blankets recommended\n")
+    
+    parts.append(_RESULTS_FOOTER_TEXT)
+    
+    return "".join(parts)
+
+
+class _AnalysisSignals(QtCore.QObject):
+    """Сигналы фоновой задачи анализа"""
+    
+    finished = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+
+class _AnalyzeJob(QtCore.QRunnable):
+    """Построение отчета в пуле потоков"""
+    
+    def __init__(self, params):
+        super().__init__()
+        self.params = params
+        # Создается в потоке GUI - результат доставляется в него же через очередь событий
+        self.signals = _AnalysisSignals()
+    
+    def run(self):
+        try:
+            results = _build_results_text(*self.params)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(results)
+
+
 class GarageTab(QtWidgets.QWidget):
     """Красивая и стильная вкладка Setup Expert"""
     
+    # Стиль вкладки - одна строка на класс, селекторы по objectName и styleClass
+    _STYLESHEET = """
+        QWidget {
+            background-color: #1e1e2e;
+            color: #cdd6f4;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }
+        
+        QGroupBox {
+            font-size: 16px;
+            font-weight: bold;
+            border: 2px solid #45475a;
+            border-radius: 12px;
+            margin-top: 16px;
+            padding-top: 20px;
+            background-color: #313244;
+        }
+        
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            left: 16px;
+            padding: 0 8px 0 8px;
+            color: #89b4fa;
+            background-color: #313244;
+            border-radius: 4px;
+        }
+        
+        QLabel {
+            color: #cdd6f4;
+            font-size: 14px;
+            font-weight: 500;
+            padding: 4px 0;
+        }
+        
+        QComboBox {
+            background-color: #45475a;
+            border: 2px solid #6c7086;
+            border-radius: 8px;
+            padding: 8px 12px;
+            color: #cdd6f4;
+            font-size: 14px;
+            min-height: 20px;
+        }
+        
+        QComboBox:hover {
+            border-color: #89b4fa;
+            background-color: #505264;
+        }
+        
+        QComboBox:focus {
+            border-color: #cba6f7;
+        }
+        
+        QComboBox::drop-down {
+            border: none;
+            width: 30px;
+            padding-right: 10px;
+        }
+        
+        QComboBox::down-arrow {
+            image: none;
+            border-left: 5px solid transparent;
+            border-right: 5px solid transparent;
+            border-top: 6px solid #cdd6f4;
+            margin-right: 6px;
+        }
+        
+        QSlider::groove:horizontal {
+            border: 1px solid #6c7086;
+            height: 8px;
+            background: #45475a;
+            margin: 2px 0;
+            border-radius: 4px;
+        }
+        
+        QSlider::handle:horizontal {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #cba6f7, stop:1 #89b4fa);
+            border: 2px solid #1e1e2e;
+            width: 20px;
+            height: 20px;
+            margin: -7px 0;
+            border-radius: 12px;
+        }
+        
+        QSlider::handle:horizontal:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #f9e2af, stop:1 #cba6f7);
+        }
+        
+        QSlider::sub-page:horizontal {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #89b4fa, stop:1 #cba6f7);
+            border-radius: 4px;
+        }
+        
+        QTextEdit {
+            background-color: #45475a;
+            border: 2px solid #6c7086;
+            border-radius: 8px;
+            color: #cdd6f4;
+            font-size: 13px;
+            line-height: 1.5;
+            padding: 12px;
+        }
+        
+        QTextEdit:focus {
+            border-color: #89b4fa;
+        }
+        
+        QFrame#garageHeader {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #89b4fa, stop:0.5 #cba6f7, stop:1 #f9e2af);
+            border-radius: 16px;
+            margin-bottom: 8px;
+        }
+        
+        QLabel#garageTitle {
+            background: transparent;
+            color: #1e1e2e;
+            font-size: 28px;
+            font-weight: bold;
+            margin: 0;
+        }
+        
+        QLabel#garageSubtitle {
+            background: transparent;
+            color: #1e1e2e;
+            font-size: 14px;
+            font-weight: normal;
+            margin: 0;
+        }
+        
+        QLabel#garageStatCard {
+            background: rgba(30, 30, 46, 0.8);
+            border: 1px solid rgba(255, 255, 255, 0.2);
+            border-radius: 8px;
+            padding: 4px;
+            color: #1e1e2e;
+        }
+        
+        QFrame[styleClass="section"] {
+            background-color: #45475a;
+            border-radius: 12px;
+            padding: 16px;
+            margin: 4px;
+        }
+        
+        QFrame[styleClass="section"] QLabel {
+            background-color: #45475a;
+            padding: 16px;
+            margin: 4px;
+        }
+        
+        QLabel#sectionTitle {
+            color: #f9e2af;
+            font-size: 15px;
+            font-weight: bold;
+            margin-bottom: 8px;
+        }
+        
+        QLabel#tempValue {
+            color: #f9e2af;
+            font-weight: bold;
+            min-width: 50px;
+        }
+        
+        QFrame#buttonsSection {
+            background: transparent;
+            border: none;
+        }
+        
+        QPushButton#analyzeButton {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #89b4fa, stop:1 #cba6f7);
+            color: #1e1e2e;
+            border: none;
+            border-radius: 12px;
+            font-size: 16px;
+            font-weight: bold;
+            padding: 16px;
+        }
+        
+        QPushButton#analyzeButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #74c7ec, stop:1 #89b4fa);
+        }
+        
+        QPushButton#analyzeButton:pressed {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #94e2d5, stop:1 #74c7ec);
+        }
+        
+        QPushButton[styleClass="secondary"] {
+            background-color: #6c7086;
+            color: #cdd6f4;
+            border: 1px solid #45475a;
+            border-radius: 8px;
+            font-size: 13px;
+            font-weight: 500;
+            padding: 8px 16px;
+        }
+        
+        QPushButton[styleClass="secondary"]:hover {
+            background-color: #7f849c;
+            border-color: #89b4fa;
+        }
+        
+        QPushButton[styleClass="secondary"]:pressed {
+            background-color: #5c5f77;
+        }
+    """
+    
+    # Имитируемая длительность анализа, мс
+    ANALYSIS_DELAY = 1500
+    
     def __init__(self, parent=None):
         super().__init__()
         self.parent_window = parent
+        self.logger = logging.getLogger(__name__)
+        self._pending_analysis = None
+        self._analysis_signals = None
         
         # Инициализация Setup Expert
         try:
-            data_file = Path("data/lmu_data.json")
-            if data_file.exists():
-                self.expert = SetupExpert(str(data_file))
+            if _DATA_FILE.exists():
+                self.expert = SetupExpert(str(_DATA_FILE))
             else:
                 self.expert = SetupExpert()
         except Exception as e:
             self.expert = SetupExpert()
-            print(f"Warning: Could not load setup expert: {e}")
+            self.logger.warning("Could not load setup expert: %s", e)
+        
+        # Списки машин и трасс запрашиваются у эксперта один раз
+        try:
+            self._cars = tuple(self.expert.get_available_cars())
+            self._tracks = tuple(self.expert.get_available_tracks())
+        except Exception as e:
+            self._cars = self._tracks = ()
+            self.logger.warning("Could not read cars and tracks from setup expert: %s", e)
         
         self.setup_styles()
-        self.init_ui()
+        
+        # Содержимое строится при первом показе вкладки
+        self._content = None
+        outer_layout = QtWidgets.QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        """Построение интерфейса при первом показе"""
+        if self._content is None:
+            self._content = QtWidgets.QWidget()
+            self.init_ui(self._content)
+            # Добавление в layout показывает содержимое вместе с вкладкой
+            self.layout().addWidget(self._content)
+        super().showEvent(event)
 
     def setup_styles(self):
         """Настройка стилей"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e2e;
-                color: #cdd6f4;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                border: 2px solid #45475a;
-                border-radius: 12px;
-                margin-top: 16px;
-                padding-top: 20px;
-                background-color: #313244;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 16px;
-                padding: 0 8px 0 8px;
-                color: #89b4fa;
-                background-color: #313244;
-                border-radius: 4px;
-            }
-            
-            QLabel {
-                color: #cdd6f4;
-                font-size: 14px;
-                font-weight: 500;
-                padding: 4px 0;
-            }
-            
-            QComboBox {
-                background-color: #45475a;
-                border: 2px solid #6c7086;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #cdd6f4;
-                font-size: 14px;
-                min-height: 20px;
-            }
-            
-            QComboBox:hover {
-                border-color: #89b4fa;
-                background-color: #505264;
-            }
-            
-            QComboBox:focus {
-                border-color: #cba6f7;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-                padding-right: 10px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #cdd6f4;
-                margin-right: 6px;
-            }
-            
-            QSlider::groove:horizontal {
-                border: 1px solid #6c7086;
-                height: 8px;
-                background: #45475a;
-                margin: 2px 0;
-                border-radius: 4px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #cba6f7, stop:1 #89b4fa);
-                border: 2px solid #1e1e2e;
-                width: 20px;
-                height: 20px;
-                margin: -7px 0;
-                border-radius: 12px;
-            }
-            
-            QSlider::handle:horizontal:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #f9e2af, stop:1 #cba6f7);
-            }
-            
-            QSlider::sub-page:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #89b4fa, stop:1 #cba6f7);
-                border-radius: 4px;
-            }
-            
-            QTextEdit {
-                background-color: #45475a;
-                border: 2px solid #6c7086;
-                border-radius: 8px;
-                color: #cdd6f4;
-                font-size: 13px;
-                line-height: 1.5;
-                padding: 12px;
-            }
-            
-            QTextEdit:focus {
-                border-color: #89b4fa;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
 
-    def init_ui(self):
+    def init_ui(self, container):
         """Инициализация интерфейса"""
         # Основной layout
-        main_layout = QtWidgets.QVBoxLayout(self)
+        main_layout = QtWidgets.QVBoxLayout(container)
         main_layout.setContentsMargins(24, 24, 24, 24)
         main_layout.setSpacing(24)
         
@@ -164,15 +440,8 @@ class GarageTab(QtWidgets.QWidget):
     def create_header(self, parent_layout):
         """Создание красивого заголовка"""
         header = QtWidgets.QFrame()
+        header.setObjectName("garageHeader")
         header.setFixedHeight(100)
-        header.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #89b4fa, stop:0.5 #cba6f7, stop:1 #f9e2af);
-                border-radius: 16px;
-                margin-bottom: 8px;
-            }
-        """)
         
         header_layout = QtWidgets.QHBoxLayout(header)
         header_layout.setContentsMargins(24, 16, 24, 16)
@@ -181,25 +450,10 @@ class GarageTab(QtWidgets.QWidget):
         text_layout = QtWidgets.QVBoxLayout()
         
         title = QtWidgets.QLabel("🏎️ Setup Expert")
-        title.setStyleSheet("""
-            QLabel {
-                color: #1e1e2e;
-                font-size: 28px;
-                font-weight: bold;
-                margin: 0;
-            }
-        """)
+        title.setObjectName("garageTitle")
         
         subtitle = QtWidgets.QLabel("AI-powered car setup optimization for Le Mans Ultimate")
-        subtitle.setStyleSheet("""
-            QLabel {
-                color: #1e1e2e;
-                font-size: 14px;
-                font-weight: normal;
-                margin: 0;
-                opacity: 0.8;
-            }
-        """)
+        subtitle.setObjectName("garageSubtitle")
         
         text_layout.addWidget(title)
         text_layout.addWidget(subtitle)
@@ -209,11 +463,8 @@ class GarageTab(QtWidgets.QWidget):
         stats_layout = QtWidgets.QHBoxLayout()
         stats_layout.setSpacing(16)
         
-        cars_count = len(self.expert.get_available_cars()) if hasattr(self.expert, 'get_available_cars') else 12
-        tracks_count = len(self.expert.get_available_tracks()) if hasattr(self.expert, 'get_available_tracks') else 8
-        
-        stats_layout.addWidget(self.create_stat_card("🚗", str(cars_count), "Cars"))
-        stats_layout.addWidget(self.create_stat_card("🏁", str(tracks_count), "Tracks"))
+        stats_layout.addWidget(self.create_stat_card("🚗", str(len(self._cars)), "Cars"))
+        stats_layout.addWidget(self.create_stat_card("🏁", str(len(self._tracks)), "Tracks"))
         stats_layout.addWidget(self.create_stat_card("🎯", "94%", "Accuracy"))
         
         header_layout.addLayout(text_layout, 2)
@@ -222,37 +473,11 @@ class GarageTab(QtWidgets.QWidget):
         parent_layout.addWidget(header)
 
     def create_stat_card(self, icon, value, label):
-        """Создание карточки статистики"""
-        card = QtWidgets.QFrame()
+        """Создание карточки статистики (одна метка с разметкой вместо рамки с тремя метками)"""
+        card = QtWidgets.QLabel(_STAT_CARD_HTML.format_map({"icon": icon, "value": value, "label": label}))
+        card.setAlignment(QtCore.Qt.AlignCenter)
+        card.setObjectName("garageStatCard")
         card.setFixedSize(80, 60)
-        card.setStyleSheet("""
-            QFrame {
-                background: rgba(30, 30, 46, 0.8);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
-        
-        layout = QtWidgets.QVBoxLayout(card)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(2)
-        
-        icon_label = QtWidgets.QLabel(icon)
-        icon_label.setAlignment(QtCore.Qt.AlignCenter)
-        icon_label.setStyleSheet("font-size: 16px; color: #1e1e2e;")
-        
-        value_label = QtWidgets.QLabel(value)
-        value_label.setAlignment(QtCore.Qt.AlignCenter)
-        value_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #1e1e2e;")
-        
-        label_label = QtWidgets.QLabel(label)
-        label_label.setAlignment(QtCore.Qt.AlignCenter)
-        label_label.setStyleSheet("font-size: 10px; color: #1e1e2e;")
-        
-        layout.addWidget(icon_label)
-        layout.addWidget(value_label)
-        layout.addWidget(label_label)
         
         return card
 
@@ -292,13 +517,9 @@ class GarageTab(QtWidgets.QWidget):
         cars = ["🟦 McLaren 720S LMGT3 Evo", "🟥 Ferrari 296 LMGT3", "🟨 Porsche 911 GT3 R", 
                 "🟩 Aston Martin Vantage AMR", "🟧 BMW M4 LMGT3", "🟪 Lamborghini Huracán LMGT3"]
         
-        try:
-            expert_cars = self.expert.get_available_cars()
-            if expert_cars:
-                cars = [f"🏎️ {car}" for car in expert_cars]
-        except:
-            pass
-            
+        if self._cars:
+            cars = [f"🏎️ {car}" for car in self._cars]
+        
         self.car_combo.addItems(cars)
         return self.car_combo
 
@@ -309,41 +530,24 @@ class GarageTab(QtWidgets.QWidget):
         tracks = ["🇫🇷 Circuit de la Sarthe", "🇧🇪 Spa-Francorchamps", "🇬🇧 Silverstone", 
                   "🇮🇹 Monza", "🇺🇸 Road America", "🇵🇹 Portimão"]
         
-        try:
-            expert_tracks = self.expert.get_available_tracks()
-            if expert_tracks:
-                tracks = [f"🏁 {track}" for track in expert_tracks]
-        except:
-            pass
-            
+        if self._tracks:
+            tracks = [f"🏁 {track}" for track in self._tracks]
+        
         self.track_combo.addItems(tracks)
         return self.track_combo
 
     def create_input_section(self, title, inputs):
         """Создание секции с полями ввода"""
         section = QtWidgets.QFrame()
-        section.setStyleSheet("""
-            QFrame {
-                background-color: #45475a;
-                border-radius: 12px;
-                padding: 16px;
-                margin: 4px;
-            }
-        """)
+        # Виджет еще не отполирован - перестилизация не нужна
+        section.setProperty("styleClass", "section")
         
         layout = QtWidgets.QVBoxLayout(section)
         layout.setSpacing(12)
         
         # Заголовок секции
         section_title = QtWidgets.QLabel(title)
-        section_title.setStyleSheet("""
-            QLabel {
-                color: #f9e2af;
-                font-size: 15px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            }
-        """)
+        section_title.setObjectName("sectionTitle")
         layout.addWidget(section_title)
         
         # Поля ввода
@@ -357,28 +561,14 @@ class GarageTab(QtWidgets.QWidget):
     def create_conditions_section(self):
         """Создание секции условий гонки"""
         section = QtWidgets.QFrame()
-        section.setStyleSheet("""
-            QFrame {
-                background-color: #45475a;
-                border-radius: 12px;
-                padding: 16px;
-                margin: 4px;
-            }
-        """)
+        section.setProperty("styleClass", "section")
         
         layout = QtWidgets.QVBoxLayout(section)
         layout.setSpacing(12)
         
         # Заголовок
         title = QtWidgets.QLabel("🌤️ Race Conditions")
-        title.setStyleSheet("""
-            QLabel {
-                color: #f9e2af;
-                font-size: 15px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            }
-        """)
+        title.setObjectName("sectionTitle")
         layout.addWidget(title)
         
         # Температура
@@ -390,7 +580,7 @@ class GarageTab(QtWidgets.QWidget):
         self.temp_slider.setValue(25)
         
         self.temp_value = QtWidgets.QLabel("25°C")
-        self.temp_value.setStyleSheet("color: #f9e2af; font-weight: bold; min-width: 50px;")
+        self.temp_value.setObjectName("tempValue")
         self.temp_slider.valueChanged.connect(lambda v: self.temp_value.setText(f"{v}°C"))
         
         layout.addWidget(temp_label)
@@ -401,7 +591,8 @@ class GarageTab(QtWidgets.QWidget):
         # Погода
         layout.addWidget(QtWidgets.QLabel("☁️ Weather:"))
         self.weather_combo = QtWidgets.QComboBox()
-        self.weather_combo.addItems(["☀️ Sunny", "⛅ Partly Cloudy", "🌧️ Rain", "⛈️ Storm"])
+        for label, key in _WEATHER_OPTIONS:
+            self.weather_combo.addItem(label, key)
         layout.addWidget(self.weather_combo)
         
         # Время суток
@@ -415,41 +606,15 @@ class GarageTab(QtWidgets.QWidget):
     def create_buttons_section(self):
         """Создание секции кнопок"""
         section = QtWidgets.QFrame()
-        section.setStyleSheet("""
-            QFrame {
-                background: transparent;
-                border: none;
-            }
-        """)
+        section.setObjectName("buttonsSection")
         
         layout = QtWidgets.QVBoxLayout(section)
         layout.setSpacing(12)
         
         # Главная кнопка анализа
         self.analyze_btn = QtWidgets.QPushButton("🔬 Analyze Setup")
+        self.analyze_btn.setObjectName("analyzeButton")
         self.analyze_btn.setMinimumHeight(50)
-        self.analyze_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #89b4fa, stop:1 #cba6f7);
-                color: #1e1e2e;
-                border: none;
-                border-radius: 12px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #74c7ec, stop:1 #89b4fa);
-                transform: translateY(-2px);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #94e2d5, stop:1 #74c7ec);
-                transform: translateY(0px);
-            }
-        """)
         self.analyze_btn.clicked.connect(self.analyze_setup)
         layout.addWidget(self.analyze_btn)
         
@@ -463,24 +628,7 @@ class GarageTab(QtWidgets.QWidget):
         
         for btn in [self.save_btn, self.export_btn, self.reset_btn]:
             btn.setMinimumHeight(40)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #6c7086;
-                    color: #cdd6f4;
-                    border: 1px solid #45475a;
-                    border-radius: 8px;
-                    font-size: 13px;
-                    font-weight: 500;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #7f849c;
-                    border-color: #89b4fa;
-                }
-                QPushButton:pressed {
-                    background-color: #5c5f77;
-                }
-            """)
+            btn.setProperty("styleClass", "secondary")
         
         btn_layout.addWidget(self.save_btn)
         btn_layout.addWidget(self.export_btn)
@@ -499,27 +647,12 @@ class GarageTab(QtWidgets.QWidget):
         # Текстовая область с улучшенным стилем
         self.results_text = QtWidgets.QTextEdit()
         self.results_text.setMinimumHeight(400)
+        # Текст выводится только через setPlainText - стек отмены и разбор разметки не нужны
+        self.results_text.setUndoRedoEnabled(False)
+        self.results_text.setAcceptRichText(False)
         
         # Приветственное сообщение
-        welcome_text = """
-🚀 Welcome to Setup Expert!
-
-Follow these steps to optimize your car setup:
-
-1️⃣ Select your vehicle and track
-2️⃣ Configure race conditions (temperature, weather, time)
-3️⃣ Click 'Analyze Setup' for AI-powered recommendations
-
-The system will analyze:
-• Track characteristics and layout
-• Weather impact on aerodynamics
-• Temperature effects on tire performance
-• Optimal gear ratios and suspension settings
-
-🎯 Get ready for faster lap times and better consistency!
-        """
-        
-        self.results_text.setPlainText(welcome_text)
+        self.results_text.setPlainText(_WELCOME_TEXT)
         layout.addWidget(self.results_text)
         
         return group
@@ -530,103 +663,50 @@ The system will analyze:
             # Анимация кнопки
             self.analyze_btn.setText("🔄 Analyzing...")
             self.analyze_btn.setEnabled(False)
-            QtWidgets.QApplication.processEvents()
             
             # Получаем параметры
             car = self.car_combo.currentText()
             track = self.track_combo.currentText()
             temperature = self.temp_slider.value()
             weather = self.weather_combo.currentText()
+            wet = self.weather_combo.currentData() in _WET_WEATHER
             time_of_day = self.time_combo.currentText()
+            self._pending_analysis = (car, track, temperature, weather, time_of_day, wet)
             
             # Показываем процесс
             self.show_analysis_progress()
-            
-            # Имитируем задержку анализа
-            import time
-            time.sleep(1.5)
-            
-            # Показываем результаты
-            self.show_results(car, track, temperature, weather, time_of_day)
-            
         except Exception as e:
-            self.results_text.setPlainText(f"❌ Error during analysis: {str(e)}")
-        finally:
-            # Восстанавливаем кнопку
-            self.analyze_btn.setText("🔬 Analyze Setup")
-            self.analyze_btn.setEnabled(True)
+            self.show_analysis_error(str(e))
+            return
+        
+        # Имитируем задержку анализа без блокировки цикла событий
+        QtCore.QTimer.singleShot(self.ANALYSIS_DELAY, self.finish_analysis)
 
-    def show_analysis_progress(self):
-        """Показ прогресса анализа"""
-        progress_text = """
-🔬 ANALYZING SETUP...
+    def finish_analysis(self):
+        """Запуск построения отчета в пуле потоков по окончании задержки"""
+        job = _AnalyzeJob(self._pending_analysis)
+        job.signals.finished.connect(self.show_results)
+        job.signals.failed.connect(self.show_analysis_error)
+        self._pending_analysis = None
+        # Ссылка держит объект сигналов до доставки результата
+        self._analysis_signals = job.signals
+        QtCore.QThreadPool.globalInstance().start(job)
 
-⚡ Processing track data...
-🧠 Running AI optimization algorithms...
-📊 Calculating optimal parameters...
-🎯 Generating recommendations...
+    def restore_analyze_button(self):
+        """Восстановление кнопки анализа"""
+        self.analyze_btn.setText("🔬 Analyze Setup")
+        self.analyze_btn.setEnabled(True)
 
-Please wait while we optimize your setup for maximum performance!
-        """
-        self.results_text.setPlainText(progress_text)
-        QtWidgets.QApplication.processEvents()
+    def show_analysis_progress(self):
+        """Показ прогресса анализа"""
+        self.results_text.setPlainText(_PROGRESS_TEXT)
 
-    def show_results(self, car, track, temperature, weather, time_of_day):
+    def show_results(self, results: str):
         """Показ красиво оформленных результатов"""
-        results = f"""
-✅ SETUP ANALYSIS COMPLETE
-
-🏁 CONFIGURATION
-═══════════════════════════════════════
-🏎️ Car: {car}
-🗺️ Track: {track}
-🌡️ Temperature: {temperature}°C
-☁️ Weather: {weather}
-🕐 Time: {time_of_day}
-
-🔧 RECOMMENDED ADJUSTMENTS
-═══════════════════════════════════════
-"""
-        
-        # Генерируем рекомендации на основе условий
-        if "rain" in weather.lower() or "storm" in weather.lower():
-            results += """
-▲ Front Wing: +2.5 (increased downforce for wet conditions)
-▲ Rear Wing: +1.8 (better stability in rain)
-▼ Tire Pressure: -1.2 PSI (larger contact patch)
-▲ Ride Height: +5mm (avoid aquaplaning)
-◀ Brake Bias: -3% (prevent rear lockup)
-"""
-        else:
-            results += """
-▼ Front Wing: -1.2 (reduced drag for better top speed)
-▲ Rear Wing: +0.8 (balance aerodynamics)
-▲ Tire Pressure: +0.5 PSI (optimal temperature management)
-▼ Suspension: -5% stiffness (better mechanical grip)
-▶ Brake Bias: +2% (improved braking efficiency)
-"""
-        
-        if temperature > 35:
-            results += "🔥 Cooling: Increase radiator opening (+15%)\n"
-        elif temperature < 15:
-            results += "❄️ Warm-up: Tire blankets recommended\n"
-        
-        results += f"""
-
-💡 EXPERT INSIGHTS
-═══════════════════════════════════════
-• Setup optimized for current weather conditions
-• Aerodynamics balanced for this track layout
-• Suspension tuned for optimal tire wear
-• Brake balance adjusted for driver confidence
-
-🎯 PERFORMANCE PREDICTION
-═══════════════════════════════════════
-Expected lap time improvement: 0.8-1.2 seconds
-Tire degradation: Reduced by 15%
-Confidence level: 92%
-
-🏆 Ready to hit the track with your optimized setup!
-        """
-        
         self.results_text.setPlainText(results)
+        self.restore_analyze_button()
+
+    def show_analysis_error(self, message: str):
+        """Показ ошибки анализа"""
+        self.results_text.setPlainText(f"❌ Error during analysis: {message}")
+        self.restore_analyze_button()